@@ -1,43 +1,2188 @@
 import sys
 import json
+import re
+import gc
+import argparse
+import tracemalloc
 import os
+import copy
+import shutil
 import logging
+import tempfile
+import functools
+import contextlib
+import asyncio
+import threading
+import concurrent.futures
+import hashlib
+import hmac
+import secrets
+import time
+import uuid
+from html import escape as html_escape
+from http import HTTPStatus
+from urllib.parse import urlsplit, parse_qs
 # import winsound  <-- REMOVED
 import datetime
 import platform
 import ctypes
-import numpy as np
-import matplotlib.pyplot as plt
+import math
+import calendar
+import bisect
+import gzip
+import collections
 from plyer import notification
 
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QTabWidget, QLabel, QLineEdit, QPushButton, QComboBox,
-    QScrollArea, QCheckBox, QDialog, QMenuBar, QDialogButtonBox,
+    QCheckBox, QDialog, QMenuBar, QDialogButtonBox,
     QTextEdit, QSpacerItem, QSizePolicy, QMessageBox, QGridLayout,
-    QListWidget, QListWidgetItem, QAbstractItemView,
-    QGroupBox, QSpinBox
+    QListWidget, QListWidgetItem, QAbstractItemView, QProgressBar,
+    QGroupBox, QSpinBox, QStackedWidget, QCalendarWidget, QDateTimeEdit, QDateEdit, QInputDialog
 )
-from PyQt6.QtCore import QTimer, Qt
-from PyQt6.QtGui import QAction, QFont, QPixmap
+from PyQt6.QtCore import (
+    QTimer, Qt, QFileSystemWatcher, QLockFile, QObject, pyqtSignal,
+    QPointF, QRectF, QVariantAnimation, QEasingCurve, QDate, QDateTime, QEvent, QEventLoop
+)
+from PyQt6.QtGui import QAction, QActionGroup, QKeySequence, QFont, QPixmap, QColor, QPen, QPainter, QPainterPath, QPolygonF, QTextCharFormat
 
 # --- Basic Configuration ---
 logging.basicConfig(level=logging.INFO, handlers=[logging.StreamHandler()], format="%(asctime)s - %(levelname)s - %(message)s")
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 
-# --- Productivity Tracker Paths ---
-DATA_FILE = os.path.join(SCRIPT_DIR, "productivity_data.json")
-SETTINGS_FILE = os.path.join(SCRIPT_DIR, "settings.json")
+# --- Profile Paths (relative to each profile's directory) ---
+DATA_FILE = "productivity_data.json"
+SETTINGS_FILE = "settings.json"
+RPG_DATA_FILE = os.path.join("stats", "progress_data.json")
+RPG_WALLPAPER_FILE = os.path.join("Wallpaper", "wallpaper.png")
+ARCHIVE_DIR = "archive"
+HISTORY_DIR = "history"
+UNDO_FILE = "undo_log.json"
+RECURRING_FILE = "recurring.json"
+
+# --- Profiles ---
+DEFAULT_PROFILE = "Default"
+# The default profile keeps using the files next to the script, where all data used to live
+DEFAULT_PROFILE_DIR = SCRIPT_DIR
+PROFILES_DIR = os.path.join(SCRIPT_DIR, "profiles")
+PROFILES_FILE = os.path.join(PROFILES_DIR, "profiles.json")
+# Profiles kept parsed in memory; switching to one of these is instant, others load in the background
+PROFILE_CACHE_SIZE = 3
+# Windows can't create a folder whose name ends in a dot or space
+PROFILE_NAME_PATTERN = re.compile(r"\w(?:[\w .'-]{0,38}[\w'-])?")
+# Device names Windows reserves, with or without an extension
+RESERVED_FILE_NAMES = {"CON", "PRN", "AUX", "NUL", *(f"COM{n}" for n in range(1, 10)), *(f"LPT{n}" for n in range(1, 10))}
+# Task rows given their widgets per event-loop turn when a list is (re)built
+LIST_RENDER_BATCH = 100
+# Tabs that show each file loaded at startup; they stay disabled until it arrives
+STARTUP_PART_TABS = {
+    "data": ("Dashboard", "Todo List", "Eat the Frog", "Eisenhower", "3/3/3", "Ivy Lee Method"),
+    "settings": (),
+    "rpg": ("RPG Stats",),
+}
+
+# --- Daily Rollover ---
+ROLLOVER_SLACK_MS = 2000
+
+# --- Task History ---
+HISTORY_RECORD_DELAY_MS = 2000
+HISTORY_CHUNK_DELTAS = 500
+HISTORY_TIME_FORMAT = "%Y%m%dT%H%M%S%f"
+HISTORY_DASHBOARD_DAYS = 14
+
+# --- Undo / Redo ---
+UNDO_MAX_STEPS = 500
+# Encoded size of all kept steps; the oldest are evicted past it, but the newest step is always kept
+UNDO_MAX_BYTES = 2 * 1024 * 1024
+# Edits to the same text field this close together are undone as one step
+UNDO_MERGE_MS = 1500
+
+# --- Multi-Instance File Sync ---
+FILE_LOCK_TIMEOUT_MS = 2000
+FILE_LOCK_STALE_MS = 10000
+FILE_SYNC_DEBOUNCE_MS = 250
+# Sections whose lists are fixed slots (merged index by index, not by task title)
+FIXED_SLOT_SECTIONS = ("3/3/3", "Ivy Lee Method")
+
+
+def _task_keys(items):
+    """Identifies list items by title (plus occurrence count, so duplicate titles stay distinct)."""
+    seen, keys = {}, []
+    for item in items:
+        title = item.get("title") if isinstance(item, dict) else json.dumps(item, sort_keys=True)
+        count = seen.get(title, 0)
+        seen[title] = count + 1
+        keys.append((title, count))
+    return keys
+
+
+def _merge_lists(base, ours, theirs, by_slot):
+    if by_slot and len(ours) == len(theirs):
+        if len(base) != len(ours):
+            base = [None] * len(ours)
+        return [_merge_values(b, o, t, by_slot) for b, o, t in zip(base, ours, theirs)]
+    base_map = dict(zip(_task_keys(base), base))
+    ours_map = dict(zip(_task_keys(ours), ours))
+    merged = []
+    for key, item in zip(_task_keys(theirs), theirs):
+        if key in ours_map:
+            merged.append(_merge_values(base_map.get(key), ours_map[key], item, by_slot))
+        elif key not in base_map or base_map[key] != item:
+            merged.append(item)  # added on disk, or edited on disk after we deleted it
+    theirs_keys = set(_task_keys(theirs))
+    for key, item in ours_map.items():
+        if key in theirs_keys:
+            continue
+        if key not in base_map or base_map[key] != item:
+            merged.append(item)  # added locally, or edited locally after it was deleted on disk
+    return merged
+
+
+def _merge_values(base, ours, theirs, by_slot=False):
+    """Three-way merges one JSON value. On a true conflict the version on disk wins."""
+    if ours == theirs:
+        return theirs
+    if ours == base:
+        return theirs
+    if theirs == base:
+        return ours
+    if isinstance(ours, dict) and isinstance(theirs, dict):
+        base = base if isinstance(base, dict) else {}
+        merged = {}
+        for key in list(theirs) + [k for k in ours if k not in theirs]:
+            if key not in ours:
+                if key not in base or base[key] != theirs[key]:
+                    merged[key] = theirs[key]
+            elif key not in theirs:
+                if key not in base or base[key] != ours[key]:
+                    merged[key] = ours[key]
+            else:
+                merged[key] = _merge_values(base.get(key), ours[key], theirs[key], by_slot)
+        return merged
+    if isinstance(ours, list) and isinstance(theirs, list):
+        return _merge_lists(base if isinstance(base, list) else [], ours, theirs, by_slot)
+    return theirs
+
+
+def merge_documents(base, ours, theirs):
+    """Merges a whole data file section by section, so only touched sections change.
+
+    Top-level sections are never dropped: a section missing on one side was simply
+    written by an older version of the file.
+    """
+    base = base or {}
+    merged = {}
+    for key in list(theirs) + [k for k in ours if k not in theirs]:
+        if key in ours and key in theirs:
+            merged[key] = _merge_values(base.get(key), ours[key], theirs[key], key in FIXED_SLOT_SECTIONS)
+        else:
+            merged[key] = ours[key] if key in ours else theirs[key]
+    return merged
+
+
+class SyncedJsonFile:
+    """A JSON file that may be shared with other app instances or sync tools.
+
+    Writes are atomic and guarded by an advisory lock file. `base` remembers the
+    content last read from or written to disk, so local and external edits can be
+    three-way merged instead of one side blindly overwriting the other.
+    """
+    def __init__(self, file_path):
+        self.file_path = file_path
+        self.base = None
+        self.signature = None
+        self.lock = QLockFile(file_path + ".lock")
+        self.lock.setStaleLockTime(FILE_LOCK_STALE_MS)
+
+    @contextlib.contextmanager
+    def locked(self):
+        acquired = self.lock.tryLock(FILE_LOCK_TIMEOUT_MS)
+        if not acquired:
+            logging.warning(f"Could not lock {self.file_path}; continuing without the lock.")
+        try:
+            yield
+        finally:
+            if acquired:
+                self.lock.unlock()
+
+    def _disk_signature(self):
+        try:
+            stat = os.stat(self.file_path)
+        except OSError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
+
+    def has_external_change(self):
+        return self._disk_signature() != self.signature
+
+    def take_external_change(self):
+        """Returns whether the file changed on disk since it was last seen, marking it seen."""
+        signature = self._disk_signature()
+        changed, self.signature = signature != self.signature, signature
+        return changed
+
+    def read(self):
+        """Returns the parsed file, or None if it is missing or unreadable."""
+        signature = self._disk_signature()
+        if signature is None:
+            return None
+        try:
+            with open(self.file_path, "r") as f:
+                data = json.load(f)
+        except (json.JSONDecodeError, IOError) as e:
+            logging.error(f"Error loading {self.file_path}: {e}")
+            return None
+        if not isinstance(data, dict):
+            logging.error(f"Error loading {self.file_path}: expected a JSON object")
+            return None
+        self.signature = signature
+        return data
+
+    def write(self, data):
+        """Replaces the file atomically. Returns whether it was written; a failure is logged."""
+        try:
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(self.file_path), suffix=".tmp")
+            with os.fdopen(fd, "w") as f:
+                json.dump(data, f, indent=4)
+            os.replace(tmp_path, self.file_path)
+        except IOError as e:
+            logging.error(f"Error saving {self.file_path}: {e}")
+            return False
+        self.signature = self._disk_signature()
+        self.base = copy.deepcopy(data)
+        return True
+
+    def load(self, default_data):
+        with self.locked():
+            data = self.read()
+        if data is None:
+            data = default_data
+        for key, value in default_data.items():
+            data.setdefault(key, value)
+        # Every instance starts from the defaults for whatever the file lacks, so they are the merge base too
+        self.base = copy.deepcopy(data)
+        return data
+
+    def save(self, data):
+        """Merges in any external edits, writes the result and returns it."""
+        with self.locked():
+            if self.has_external_change():
+                theirs = self.read()
+                if theirs is not None:
+                    data = merge_documents(self.base, data, theirs)
+            self.write(data)
+        return data
+
+    def pull(self, ours):
+        """Merges external edits into `ours`. Returns the merged data and the changed top-level keys."""
+        with self.locked():
+            if not self.has_external_change():
+                return ours, set()
+            theirs = self.read()
+        if theirs is None:
+            return ours, set()
+        merged = merge_documents(self.base, ours, theirs)
+        self.base = copy.deepcopy(theirs)
+        changed = {key for key in set(merged) | set(ours) if merged.get(key) != ours.get(key)}
+        return merged, changed
+
+
+# --- Local HTTP API ---
+API_HOST = "127.0.0.1"
+API_DEFAULT_PORT = 8765
+API_PUBLISH_DELAY_MS = 50
+API_MAX_BODY_BYTES = 1024 * 1024
+API_LONG_POLL_DEFAULT_S = 30
+API_LONG_POLL_MAX_S = 60
+# URL-friendly names for the data sections; "pomodoro" and "rpg" are served alongside them
+API_DATA_SECTIONS = {
+    "todo": "Todo List", "eisenhower": "Eisenhower", "333": "3/3/3",
+    "ivy-lee": "Ivy Lee Method", "frog": "Eat the Frog",
+}
+API_SECTIONS = tuple(API_DATA_SECTIONS) + ("pomodoro", "rpg")
+API_SLUGS_BY_SECTION = {**{section: slug for slug, section in API_DATA_SECTIONS.items()}, "RPG Stats": "rpg"}
+TODO_PRIORITIES = ["High", "Medium", "Low"]
+EISENHOWER_QUADRANTS = {
+    "do": ("Urgent & Important (Do)", 0, 0), "schedule": ("Important, Not Urgent (Schedule)", 0, 1),
+    "delegate": ("Urgent, Not Important (Delegate)", 1, 0), "delete": ("Not Urgent, Not Important (Delete)", 1, 1),
+}
+
+
+class ApiError(Exception):
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+
+class ApiBridge(QObject):
+    """Carries batch mutations from the API thread to the Qt thread, which owns all app data."""
+    batch_requested = pyqtSignal(object, object)
+
+
+class LocalApiServer:
+    """A small HTTP/1.1 JSON server on localhost, run on its own asyncio loop and thread.
+
+    The Qt thread never waits on it. Reads are answered from the encoded snapshot
+    last handed over by `publish`, and batches are queued to the Qt thread through
+    `bridge`, with the HTTP response sent once the app has applied them.
+    """
+    def __init__(self, bridge, port, token):
+        self.bridge = bridge
+        self.port = port
+        # Every request must carry it as "Authorization: Bearer <token>"
+        self.token = token
+        self.loop = None
+        self.thread = None
+        self.server = None
+        self.version = 0
+        self.section_versions = {}
+        self.section_bodies = {}
+        self.state_body = b'{"version":0,"sections":{}}'
+        self.change_event = None
+
+    def start(self):
+        ready = threading.Event()
+        self.thread = threading.Thread(target=self._run, args=(ready,), name="LocalApiServer", daemon=True)
+        self.thread.start()
+        ready.wait(5)
+        return self.server is not None
+
+    def stop(self):
+        if self.loop and not self.loop.is_closed():
+            self.loop.call_soon_threadsafe(self.loop.stop)
+            self.thread.join(2)
+
+    def _run(self, ready):
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+        self.change_event = asyncio.Event()
+        try:
+            self.server = self.loop.run_until_complete(asyncio.start_server(self._handle_client, API_HOST, self.port))
+        except OSError as e:
+            logging.error(f"Could not start the local API on port {self.port}: {e}")
+            self.loop.close()
+            ready.set()
+            return
+        logging.info(f"Local API listening on http://{API_HOST}:{self.port}/api/state")
+        ready.set()
+        self.loop.run_forever()
+        self.server.close()
+        pending = asyncio.all_tasks(self.loop)
+        for task in pending:
+            task.cancel()
+        self.loop.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
+        self.loop.close()
+
+    # --- Snapshot (called from the Qt thread) ---
+    def publish(self, sections):
+        """Hands over fresh content for some sections; unchanged ones keep their version."""
+        encoded = {slug: json.dumps(value, separators=(",", ":")).encode() for slug, value in sections.items()}
+        if self.loop and not self.loop.is_closed():
+            self.loop.call_soon_threadsafe(self._apply_snapshot, encoded)
+
+    def _apply_snapshot(self, encoded):
+        changed = [slug for slug, body in encoded.items() if self.section_bodies.get(slug) != body]
+        if not changed:
+            return
+        self.version += 1
+        for slug in changed:
+            self.section_bodies[slug] = encoded[slug]
+            self.section_versions[slug] = self.version
+        sections = b",".join(json.dumps(slug).encode() + b":" + body for slug, body in self.section_bodies.items())
+        self.state_body = b'{"version":%d,"sections":{%s}}' % (self.version, sections)
+        # Wake every long-poll waiter at once; later waiters pick up the fresh event
+        self.change_event.set()
+        self.change_event = asyncio.Event()
+
+    # --- HTTP ---
+    async def _handle_client(self, reader, writer):
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+                keep_alive = headers.get("connection", "").lower() != "close"
+                try:
+                    method, target, _ = request_line.decode("latin-1").split(" ", 2)
+                    length = int(headers.get("content-length") or 0)
+                    if length > API_MAX_BODY_BYTES:
+                        raise ApiError(413, "Request body too large")
+                    body = await reader.readexactly(length) if length else b""
+                    status, extra_headers, payload = await self._dispatch(method, target, headers, body)
+                except ApiError as e:
+                    status, extra_headers, payload = e.status, {}, json.dumps({"error": str(e)}).encode()
+                except ValueError:
+                    status, extra_headers, payload = 400, {}, b'{"error":"Malformed request"}'
+                    keep_alive = False
+                writer.write(self._format_response(status, extra_headers, payload, keep_alive))
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    @staticmethod
+    def _format_response(status, headers, payload, keep_alive):
+        lines = [
+            f"HTTP/1.1 {status} {HTTPStatus(status).phrase}",
+            "Content-Type: application/json",
+            f"Content-Length: {len(payload)}",
+            "Cache-Control: no-cache",
+            f"Connection: {'keep-alive' if keep_alive else 'close'}",
+        ]
+        lines += [f"{name}: {value}" for name, value in headers.items()]
+        return ("\r\n".join(lines) + "\r\n\r\n").encode("latin-1") + payload
+
+    @staticmethod
+    def _etag_matches(headers, etag):
+        candidates = [tag.strip().removeprefix("W/") for tag in headers.get("if-none-match", "").split(",")]
+        return etag in candidates or "*" in candidates
+
+    def _check_request(self, method, headers):
+        """Turns away anything a web page could send: browsers always send the Host they
+        think they reach (so DNS rebinding shows up here), can't set Authorization
+        without a CORS preflight we never answer, and only send JSON after one too."""
+        if headers.get("host", "").lower() not in (f"127.0.0.1:{self.port}", f"localhost:{self.port}"):
+            raise ApiError(403, "Requests must be addressed to 127.0.0.1 or localhost")
+        scheme, _, token = headers.get("authorization", "").partition(" ")
+        if scheme.lower() != "bearer" or not hmac.compare_digest(token.strip().encode(), self.token.encode()):
+            raise ApiError(401, "Missing or wrong API token (see api_token in settings.json)")
+        if method == "POST" and headers.get("content-type", "").split(";")[0].strip().lower() != "application/json":
+            raise ApiError(415, "POST bodies must be sent as application/json")
+
+    async def _dispatch(self, method, target, headers, body):
+        self._check_request(method, headers)
+        url = urlsplit(target)
+        path = url.path.rstrip("/")
+        if method == "GET" and path == "/api/state":
+            return self._cached(headers, f'"v{self.version}"', self.state_body)
+        if method == "GET" and path.startswith("/api/sections/"):
+            slug = path.removeprefix("/api/sections/")
+            if slug not in self.section_bodies:
+                raise ApiError(404, f"Unknown section '{slug}'")
+            return self._cached(headers, f'"v{self.section_versions[slug]}"', self.section_bodies[slug])
+        if method == "GET" and path == "/api/changes":
+            query = parse_qs(url.query)
+            since = int(query.get("since", [self.version])[0])
+            timeout = min(float(query.get("timeout", [API_LONG_POLL_DEFAULT_S])[0]), API_LONG_POLL_MAX_S)
+            return 200, {}, json.dumps(await self._wait_for_changes(since, timeout)).encode()
+        if method == "POST" and path == "/api/batch":
+            return 200, {}, json.dumps(await self._run_batch(headers, body)).encode()
+        if path in ("/api/state", "/api/changes", "/api/batch") or path.startswith("/api/sections/"):
+            raise ApiError(405, f"{method} is not allowed on {path}")
+        raise ApiError(404, f"No such endpoint: {path}")
+
+    def _cached(self, headers, etag, body):
+        if self._etag_matches(headers, etag):
+            return 304, {"ETag": etag}, b""
+        return 200, {"ETag": etag}, body
+
+    async def _wait_for_changes(self, since, timeout):
+        deadline = self.loop.time() + timeout
+        while self.version <= since:
+            remaining = deadline - self.loop.time()
+            if remaining <= 0:
+                break
+            try:
+                await asyncio.wait_for(self.change_event.wait(), remaining)
+            except asyncio.TimeoutError:
+                break
+        changed = sorted(slug for slug, version in self.section_versions.items() if version > since)
+        return {"version": self.version, "changed": changed}
+
+    async def _run_batch(self, headers, body):
+        try:
+            request = json.loads(body or b"{}")
+        except json.JSONDecodeError as e:
+            raise ApiError(400, f"Invalid JSON: {e}")
+        operations = request.get("operations") if isinstance(request, dict) else None
+        if not isinstance(operations, list):
+            raise ApiError(400, "Expected a JSON object with an 'operations' list")
+        if_match = headers.get("if-match")
+        if if_match and if_match != f'"v{self.version}"':
+            raise ApiError(412, f"State has moved on to version {self.version}")
+        future = concurrent.futures.Future()
+        self.bridge.batch_requested.emit(operations, future)
+        try:
+            result = await asyncio.wrap_future(future)
+        except ValueError as e:
+            raise ApiError(422, str(e))
+        # The app publishes before resolving the future, so this version already includes the batch
+        return dict(result, version=self.version)
+
+
+def _unfinished(tasks):
+    return [task for task in tasks if not task.get("done")]
+
+
+def _blank_if_done(slot):
+    return {"title": "", "done": False} if slot.get("done") else slot
+
+
+def _has_content(value, key=None):
+    """Whether any task title or notes anywhere in `value` is filled in."""
+    if isinstance(value, dict):
+        return any(_has_content(item, item_key) for item_key, item in value.items())
+    if isinstance(value, list):
+        return any(_has_content(item, key) for item in value)
+    return key in ("title", "notes") and isinstance(value, str) and bool(value.strip())
+
+
+def roll_over_data(data):
+    """Splits the working set at a day boundary.
+
+    Returns (snapshot, remaining): the snapshot is the whole day as it stood, for the
+    archive; the remaining data keeps only unfinished work. Finished tasks leave every
+    list, finished 3/3/3 and frog slots are cleared, unfinished Ivy Lee tasks move up
+    to the top of tomorrow's six, and the day's notes are cleared.
+    """
+    snapshot = copy.deepcopy(data)
+    remaining = copy.deepcopy(data)
+    remaining["Todo List"]["tasks"] = _unfinished(remaining["Todo List"]["tasks"])
+    for quadrant, tasks in remaining["Eisenhower"].items():
+        remaining["Eisenhower"][quadrant] = _unfinished(tasks)
+    frog = remaining["Eat the Frog"]
+    frog["frog"] = _blank_if_done(frog["frog"])
+    frog["other_tasks"] = _unfinished(frog["other_tasks"])
+    for category, slots in remaining["3/3/3"].items():
+        remaining["3/3/3"][category] = [_blank_if_done(slot) for slot in slots]
+    ivy_lee = remaining["Ivy Lee Method"]
+    slot_count = len(ivy_lee["tasks"])
+    carried_over = [task for task in _unfinished(ivy_lee["tasks"]) if task.get("title")]
+    ivy_lee["tasks"] = carried_over + [{"title": "", "done": False} for _ in range(slot_count - len(carried_over))]
+    ivy_lee["notes"] = ""
+    return snapshot, remaining
+
+
+class DailyArchive:
+    """Past days' snapshots, stored as one gzip-compressed JSON file per month
+    (e.g. archive/2025-01.json.gz mapping each date to that day's snapshot).
+
+    Segments are only read when a day in them is asked for, so the archive can
+    grow for years without affecting startup.
+    """
+    def __init__(self, directory):
+        self.directory = directory
+
+    def _segment_path(self, month):
+        return os.path.join(self.directory, f"{month}.json.gz")
+
+    def months(self):
+        if not os.path.isdir(self.directory):
+            return []
+        return sorted(name.removesuffix(".json.gz") for name in os.listdir(self.directory) if name.endswith(".json.gz"))
+
+    def read_month(self, month):
+        """Returns {date: snapshot} for a "YYYY-MM" month, or {} if nothing was archived then."""
+        path = self._segment_path(month)
+        if not os.path.exists(path):
+            return {}
+        try:
+            with gzip.open(path, "rt", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, EOFError, json.JSONDecodeError) as e:
+            logging.error(f"Error loading archive segment {path}: {e}")
+            return {}
+
+    def get_day(self, date):
+        return self.read_month(date[:7]).get(date)
+
+    def add_day(self, date, snapshot):
+        os.makedirs(self.directory, exist_ok=True)
+        path = self._segment_path(date[:7])
+        lock = QLockFile(path + ".lock")
+        lock.setStaleLockTime(FILE_LOCK_STALE_MS)
+        acquired = lock.tryLock(FILE_LOCK_TIMEOUT_MS)
+        try:
+            segment = self.read_month(date[:7])
+            segment[date] = snapshot
+            fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+            with gzip.open(os.fdopen(fd, "wb"), "wt", encoding="utf-8") as f:
+                json.dump(segment, f, separators=(",", ":"))
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logging.error(f"Error saving archive segment {path}: {e}")
+        finally:
+            if acquired:
+                lock.unlock()
+
+
+def _snapshot_tasks(content):
+    if isinstance(content, list):
+        return [item for item in content if isinstance(item, dict) and item.get("title")]
+    if isinstance(content, dict):
+        if content.get("title"):
+            return [content]
+        return [task for value in content.values() for task in _snapshot_tasks(value)]
+    return []
+
+
+def snapshot_html(heading, snapshot):
+    """Renders a copy of the task data as a read-only checklist per section."""
+    html = f"<h2>{html_escape(heading)}</h2>"
+    for section, content in snapshot.items():
+        tasks = _snapshot_tasks(content)
+        if tasks:
+            items = "".join(f"<li>{'&#10003;' if task.get('done') else '&#9744;'} {html_escape(task['title'])}</li>" for task in tasks)
+            html += f"<h3>{html_escape(section)}</h3><ul>{items}</ul>"
+        if isinstance(content, dict) and content.get("notes"):
+            html += f"<p><b>Notes:</b> {html_escape(content['notes'])}</p>"
+    return html
+
+
+class ArchiveDialog(QDialog):
+    """Browses archived days; a month's segment is read only when the calendar shows it."""
+    def __init__(self, archive, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("Archive")
+        self.setMinimumSize(750, 450)
+        self.archive = archive
+        self.segments = {}
+        layout = QHBoxLayout(self)
+        self.calendar = QCalendarWidget()
+        self.calendar.setGridVisible(True)
+        self.calendar.setMaximumDate(QDate.currentDate())
+        self.calendar.currentPageChanged.connect(self._highlight_month)
+        self.calendar.selectionChanged.connect(self._show_selected_day)
+        self.details = QTextEdit(readOnly=True)
+        layout.addWidget(self.calendar)
+        layout.addWidget(self.details, 1)
+        months = archive.months()
+        if months:
+            last_day = max(self._segment(months[-1]))
+            self.calendar.setSelectedDate(QDate.fromString(last_day, Qt.DateFormat.ISODate))
+        self._highlight_month(self.calendar.yearShown(), self.calendar.monthShown())
+        self._show_selected_day()
+
+    def _segment(self, month):
+        if month not in self.segments:
+            self.segments[month] = self.archive.read_month(month)
+        return self.segments[month]
+
+    def _highlight_month(self, year, month):
+        bold = QTextCharFormat()
+        bold.setFontWeight(QFont.Weight.Bold)
+        bold.setForeground(QColor("#3f51b5"))
+        for date in self._segment(f"{year:04d}-{month:02d}"):
+            self.calendar.setDateTextFormat(QDate.fromString(date, Qt.DateFormat.ISODate), bold)
+
+    def _show_selected_day(self):
+        date = self.calendar.selectedDate().toString(Qt.DateFormat.ISODate)
+        snapshot = self._segment(date[:7]).get(date)
+        if not snapshot:
+            self.details.setHtml(f"<h2>{date}</h2><p>Nothing was archived for this day.</p>")
+        else:
+            self.details.setHtml(snapshot_html(date, snapshot))
+
+
+# --- Recurring Tasks ---
+RECURRENCE_REPEATS = {"daily": "Every day", "weekdays": "Every weekday", "weekly": "Every week", "monthly": "Every month"}
+# Lists a recurring task or template item can go to, named as in the local API's batch operations
+RECURRING_LISTS = {
+    "todo": "Todo List", "frog": "Eat the Frog",
+    **{f"eisenhower/{key}": f"Eisenhower: {title}" for key, (title, _, _) in EISENHOWER_QUADRANTS.items()},
+    "333/outcomes": "3/3/3: Major Outcomes", "333/deep_work": "3/3/3: Deep Work", "333/maintenance": "3/3/3: Maintenance",
+    "ivy-lee": "Ivy Lee Method",
+}
+
+
+def is_iso_date(value):
+    """Whether `value` is a date written as YYYY-MM-DD, the only form the data files use."""
+    try:
+        return datetime.date.fromisoformat(value).isoformat() == value
+    except (TypeError, ValueError):
+        return False
+
+
+def _valid_recurring_item(item):
+    return isinstance(item, dict) and isinstance(item.get("title"), str) and item.get("list") in RECURRING_LISTS
+
+
+def _valid_rule(rule):
+    if not isinstance(rule, dict) or not isinstance(rule.get("id"), str) or rule.get("repeat") not in RECURRENCE_REPEATS:
+        return False
+    if not is_iso_date(rule.get("start")):
+        return False
+    if "template" in rule:
+        return isinstance(rule["template"], str)
+    return _valid_recurring_item(rule)
+
+
+def rule_occurs_on(rule, date):
+    """Whether a recurring rule falls on `date`. Worked out when asked, so no occurrence is ever stored ahead of time."""
+    start = datetime.date.fromisoformat(rule["start"])
+    if date < start:
+        return False
+    if rule["repeat"] == "weekdays":
+        return date.weekday() < 5
+    if rule["repeat"] == "weekly":
+        return date.weekday() == start.weekday()
+    if rule["repeat"] == "monthly":
+        # A rule started on the 31st falls on the last day of shorter months
+        return date.day == min(start.day, calendar.monthrange(date.year, date.month)[1])
+    return True
+
+
+def describe_rule(rule):
+    what = f"template '{rule['template']}'" if "template" in rule else f"{rule['title']} → {RECURRING_LISTS.get(rule['list'], rule['list'])}"
+    return f"{RECURRENCE_REPEATS[rule['repeat']]} from {rule['start']}: {what}"
+
+
+class RecurringTasks:
+    """A profile's recurring task rules and day templates, kept in their own file (recurring.json).
+
+    A rule adds either one task or a whole template. Only the day being opened gets
+    real tasks: `materialized` holds the (rule id, date) pairs already added, so a
+    day gets each rule once however often it is opened, and a deleted occurrence
+    doesn't come back. Keys of past days are pruned, so the file stays the size of
+    the rules however long they have been running.
+    """
+    def __init__(self, file_path):
+        self.file = SyncedJsonFile(file_path)
+        self.rules = []
+        self.templates = {}
+        self.materialized = set()
+
+    def _content(self):
+        return {"rules": self.rules, "templates": self.templates, "materialized": sorted(list(key) for key in self.materialized)}
+
+    def _take(self, content):
+        """Keeps the well-formed parts of a parsed file; a hand-edited or damaged entry is skipped, not fatal."""
+        rules, templates, materialized = (content.get(key) if isinstance(content, dict) else None for key in ("rules", "templates", "materialized"))
+        self.rules = [rule for rule in rules if _valid_rule(rule)] if isinstance(rules, list) else []
+        self.templates = {
+            name: [item for item in items if _valid_recurring_item(item)]
+            for name, items in (templates.items() if isinstance(templates, dict) else ()) if isinstance(items, list)
+        }
+        self.materialized = {
+            tuple(key) for key in (materialized if isinstance(materialized, list) else ())
+            if isinstance(key, list) and len(key) == 2 and all(isinstance(part, str) for part in key)
+        }
+
+    def load(self):
+        self._take(self.file.load({"rules": [], "templates": {}, "materialized": []}))
+
+    def save(self):
+        self._take(self.file.save(self._content()))
+
+    def pull(self):
+        """Takes in rules, templates and occurrences another instance added since we last looked."""
+        content, changed = self.file.pull(self._content())
+        if changed:
+            self._take(content)
+
+    def add_rule(self, rule):
+        self.rules.append({"id": uuid.uuid4().hex[:12], **rule})
+
+    def remove_rule(self, rule_id):
+        self.rules = [rule for rule in self.rules if rule["id"] != rule_id]
+
+    def rules_on(self, date):
+        return [rule for rule in self.rules if rule_occurs_on(rule, date)]
+
+    def rule_items(self, rule):
+        if "template" in rule:
+            return self.templates.get(rule["template"], [])
+        return [{key: rule[key] for key in ("list", "title", "priority") if key in rule}]
+
+    def due(self, date):
+        """Returns the rules falling on `date` that haven't been materialized for it yet."""
+        return [rule for rule in self.rules_on(date) if (rule["id"], date.isoformat()) not in self.materialized]
+
+    def mark_materialized(self, rules, date):
+        day = date.isoformat()
+        self.materialized = {key for key in self.materialized if key[1] >= day}
+        self.materialized.update((rule["id"], day) for rule in rules)
+
+
+class RecurringTasksDialog(QDialog):
+    """Edits recurring rules and day templates, and previews what any day will get."""
+    def __init__(self, app):
+        super().__init__(app)
+        self.setWindowTitle("Recurring Tasks")
+        self.setMinimumSize(900, 550)
+        self.app = app
+        self.recurring = app.profile.recurring
+        layout = QHBoxLayout(self)
+        left_layout = QVBoxLayout()
+
+        rules_group = QGroupBox("Recurring Rules")
+        rules_layout = QVBoxLayout(rules_group)
+        self.rule_list = QListWidget()
+        rules_layout.addWidget(self.rule_list)
+        form_layout = QHBoxLayout()
+        self.title_entry = QLineEdit(placeholderText="Task title...")
+        self.target_combo = QComboBox()
+        self.repeat_combo = QComboBox()
+        for repeat, label in RECURRENCE_REPEATS.items():
+            self.repeat_combo.addItem(label, repeat)
+        self.start_edit = QDateEdit(QDate.currentDate(), calendarPopup=True)
+        add_button = QPushButton("Add Rule")
+        add_button.clicked.connect(self._add_rule)
+        for widget in (self.title_entry, self.target_combo, self.repeat_combo, self.start_edit, add_button):
+            form_layout.addWidget(widget)
+        form_layout.setStretch(0, 1)
+        rules_layout.addLayout(form_layout)
+        remove_rule_button = QPushButton("Delete Rule")
+        remove_rule_button.setObjectName("deleteButton")
+        remove_rule_button.clicked.connect(self._remove_rule)
+        rules_layout.addWidget(remove_rule_button, alignment=Qt.AlignmentFlag.AlignRight)
+        left_layout.addWidget(rules_group, 2)
+
+        templates_group = QGroupBox("Day Templates")
+        templates_layout = QVBoxLayout(templates_group)
+        self.template_list = QListWidget()
+        templates_layout.addWidget(self.template_list)
+        template_buttons = QHBoxLayout()
+        for text, slot in (("Save Today as Template...", self._save_template), ("Apply to Today", self._apply_template), ("Delete Template", self._remove_template)):
+            button = QPushButton(text)
+            button.clicked.connect(slot)
+            template_buttons.addWidget(button)
+        templates_layout.addLayout(template_buttons)
+        left_layout.addWidget(templates_group, 1)
+        layout.addLayout(left_layout, 3)
+
+        preview_layout = QVBoxLayout()
+        self.calendar = QCalendarWidget()
+        self.calendar.setGridVisible(True)
+        self.calendar.selectionChanged.connect(self._show_selected_day)
+        self.details = QTextEdit(readOnly=True)
+        preview_layout.addWidget(self.calendar)
+        preview_layout.addWidget(self.details, 1)
+        layout.addLayout(preview_layout, 2)
+        self._refresh()
+
+    def _refresh(self):
+        self.rule_list.clear()
+        for rule in self.recurring.rules:
+            item = QListWidgetItem(describe_rule(rule))
+            item.setData(Qt.ItemDataRole.UserRole, rule["id"])
+            self.rule_list.addItem(item)
+        self.template_list.clear()
+        self.target_combo.clear()
+        for name, label in RECURRING_LISTS.items():
+            self.target_combo.addItem(label, name)
+        for name, items in sorted(self.recurring.templates.items()):
+            item = QListWidgetItem(f"{name} ({len(items)} tasks)")
+            item.setData(Qt.ItemDataRole.UserRole, name)
+            self.template_list.addItem(item)
+            self.target_combo.addItem(f"Template: {name}", f"template/{name}")
+        self._show_selected_day()
+
+    def _add_rule(self):
+        target = self.target_combo.currentData()
+        rule = {"repeat": self.repeat_combo.currentData(), "start": self.start_edit.date().toString(Qt.DateFormat.ISODate)}
+        if target.startswith("template/"):
+            rule["template"] = target.removeprefix("template/")
+        else:
+            title = self.title_entry.text().strip()
+            if not title:
+                return
+            rule.update({"list": target, "title": title})
+            if target == "todo":
+                rule["priority"] = "Medium"
+        self.recurring.add_rule(rule)
+        self.recurring.save()
+        self.title_entry.clear()
+        # A rule that already falls on today shows up right away
+        self.app._materialize_recurring(undoable=True)
+        self._refresh()
+
+    def _remove_rule(self):
+        item = self.rule_list.currentItem()
+        if item:
+            self.recurring.remove_rule(item.data(Qt.ItemDataRole.UserRole))
+            self.recurring.save()
+            self._refresh()
+
+    def _save_template(self):
+        name, ok = QInputDialog.getText(self, "Save Day Template", "Template name:")
+        name = name.strip()
+        if ok and name:
+            self.recurring.templates[name] = self.app._day_template_items()
+            self.recurring.save()
+            self._refresh()
+
+    def _apply_template(self):
+        item = self.template_list.currentItem()
+        if item:
+            self.app._add_recurring_items(self.recurring.templates[item.data(Qt.ItemDataRole.UserRole)], undoable=True)
+
+    def _remove_template(self):
+        item = self.template_list.currentItem()
+        if item:
+            name = item.data(Qt.ItemDataRole.UserRole)
+            del self.recurring.templates[name]
+            # Rules for the template would have nothing left to add
+            self.recurring.rules = [rule for rule in self.recurring.rules if rule.get("template") != name]
+            self.recurring.save()
+            self._refresh()
+
+    def _show_selected_day(self):
+        date = self.calendar.selectedDate().toPyDate()
+        rules = self.recurring.rules_on(date)
+        if not rules:
+            self.details.setHtml(f"<h2>{date.isoformat()}</h2><p>No recurring tasks fall on this day.</p>")
+            return
+        html = f"<h2>{date.isoformat()}</h2>"
+        for rule in rules:
+            added = " (added)" if (rule["id"], date.isoformat()) in self.recurring.materialized else ""
+            tasks = "".join(f"<li>{html_escape(item['title'])} &rarr; {html_escape(RECURRING_LISTS.get(item['list'], item['list']))}</li>" for item in self.recurring.rule_items(rule))
+            html += f"<h3>{html_escape(RECURRENCE_REPEATS[rule['repeat']])}{added}</h3><ul>{tasks}</ul>"
+        self.details.setHtml(html)
+
+
+def completion_counts(data):
+    """Returns {method: (tasks, completed)} for the productivity methods, as the dashboard counts them."""
+    return {
+        "Todo List": (len(data["Todo List"]["tasks"]), sum(1 for t in data["Todo List"]["tasks"] if t.get("done"))),
+        "Eat the Frog": ((1 if data["Eat the Frog"]["frog"]["title"] else 0) + len(data["Eat the Frog"]["other_tasks"]), (1 if data["Eat the Frog"]["frog"]["done"] else 0) + sum(1 for t in data["Eat the Frog"]["other_tasks"] if t.get("done"))),
+        "Eisenhower": (sum(len(q) for q in data["Eisenhower"].values()), sum(sum(1 for t in q if t.get("done")) for q in data["Eisenhower"].values())),
+        "3/3/3": (sum(len([t for t in c if t.get("title")]) for c in data["3/3/3"].values()), sum(sum(1 for t in c if t.get("done")) for c in data["3/3/3"].values())),
+        "Ivy Lee Method": (len([t for t in data["Ivy Lee Method"]["tasks"] if t.get("title")]), sum(1 for t in data["Ivy Lee Method"]["tasks"] if t.get("done")))
+    }
+
+
+def diff_json(old, new, path=()):
+    """Returns the ops turning `old` into `new`: ["set", path, value], ["del", path]
+    and ["splice", path, start, delete_count, items]. Lists are cut down to the
+    changed middle, so adding, removing or ticking one task is a single small op.
+    """
+    if old == new:
+        return []
+    if isinstance(old, dict) and isinstance(new, dict):
+        ops = [["del", [*path, key]] for key in old if key not in new]
+        for key, value in new.items():
+            if key in old:
+                ops.extend(diff_json(old[key], value, (*path, key)))
+            else:
+                ops.append(["set", [*path, key], value])
+        return ops
+    if isinstance(old, list) and isinstance(new, list):
+        shortest = min(len(old), len(new))
+        prefix = 0
+        while prefix < shortest and old[prefix] == new[prefix]:
+            prefix += 1
+        suffix = 0
+        while suffix < shortest - prefix and old[-1 - suffix] == new[-1 - suffix]:
+            suffix += 1
+        old_middle, new_middle = old[prefix:len(old) - suffix], new[prefix:len(new) - suffix]
+        if len(old_middle) == len(new_middle) == 1:
+            return diff_json(old_middle[0], new_middle[0], (*path, prefix))
+        return [["splice", list(path), prefix, len(old_middle), new_middle]]
+    return [["set", list(path), new]]
+
+
+def apply_json_ops(state, ops):
+    for op in ops:
+        kind, path = op[0], op[1]
+        if kind == "splice":
+            target = state
+            for key in path:
+                target = target[key]
+            start, count, items = op[2], op[3], op[4]
+            target[start:start + count] = copy.deepcopy(items)
+            continue
+        parent = state
+        for key in path[:-1]:
+            parent = parent[key]
+        if kind == "set":
+            parent[path[-1]] = copy.deepcopy(op[2])
+        elif kind == "del":
+            del parent[path[-1]]
+
+
+class HistoryStore:
+    """Point-in-time history of the task data.
+
+    History is kept in chunk files (history/<start time>.jsonl): each starts with a
+    full snapshot followed by at most HISTORY_CHUNK_DELTAS compact deltas. Finished
+    chunks are gzipped. Rebuilding the state at any moment means reading one chunk
+    and replaying at most one chunk's worth of deltas.
+    """
+    def __init__(self, directory):
+        self.directory = directory
+        self.chunk_path = None
+        self.chunk_size = None
+        self.chunk_deltas = 0
+        self.lock = QLockFile(os.path.join(directory, "history.lock"))
+        self.lock.setStaleLockTime(FILE_LOCK_STALE_MS)
+        self.completion_cache = {}
+        # (path, byte offset, state) of the newest chunk as far as it has been replayed
+        self.tail = None
+
+    def _chunks(self):
+        """Returns [(start time, path)] sorted by start time."""
+        if not os.path.isdir(self.directory):
+            return []
+        chunks = []
+        for name in os.listdir(self.directory):
+            for suffix in (".jsonl", ".jsonl.gz"):
+                if name.endswith(suffix):
+                    chunks.append((name.removesuffix(suffix), os.path.join(self.directory, name)))
+        return sorted(chunks)
+
+    def _read_chunk(self, path):
+        opener = gzip.open if path.endswith(".gz") else open
+        records = []
+        try:
+            with opener(path, "rt", encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        records.append(json.loads(line))
+                    except json.JSONDecodeError:
+                        break  # a write cut short; nothing after it can be trusted
+        except (OSError, EOFError) as e:
+            logging.error(f"Error loading history chunk {path}: {e}")
+        # A chunk is only usable if it starts from a snapshot
+        return records if records and "snapshot" in records[0] else []
+
+    def _append(self, path, record):
+        with open(path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(record, separators=(",", ":")) + "\n")
+        self.chunk_size = os.path.getsize(path)
+
+    def _start_chunk(self, timestamp, data):
+        """Starts a chunk and gzips the one it replaces. Called with the lock held."""
+        # A session's first chunk also finishes any left open by earlier sessions or other instances
+        finished = [self.chunk_path] if self.chunk_path else [path for _, path in self._chunks() if path.endswith(".jsonl")]
+        self.chunk_path = os.path.join(self.directory, f"{timestamp}.jsonl")
+        self.chunk_deltas = 0
+        self._append(self.chunk_path, {"t": timestamp, "snapshot": data})
+        for path in finished:
+            if path != self.chunk_path and os.path.exists(path):
+                with open(path, "rb") as source, gzip.open(path + ".gz", "wb") as target:
+                    target.write(source.read())
+                os.remove(path)
+
+    def record(self, ops, data):
+        """Appends one delta (`ops`, leading up to `data`), starting a fresh chunk when due."""
+        os.makedirs(self.directory, exist_ok=True)
+        timestamp = datetime.datetime.now().strftime(HISTORY_TIME_FORMAT)
+        acquired = self.lock.tryLock(FILE_LOCK_TIMEOUT_MS)
+        try:
+            # If another instance wrote to our chunk, our deltas no longer apply to it
+            foreign_writes = self.chunk_path and (not os.path.exists(self.chunk_path) or os.path.getsize(self.chunk_path) != self.chunk_size)
+            if self.chunk_path is None or foreign_writes or self.chunk_deltas >= HISTORY_CHUNK_DELTAS:
+                self._start_chunk(timestamp, data)
+            else:
+                self._append(self.chunk_path, {"t": timestamp, "ops": ops})
+                self.chunk_deltas += 1
+        except OSError as e:
+            logging.error(f"Error saving history: {e}")
+        finally:
+            if acquired:
+                self.lock.unlock()
+
+    def state_at(self, moment):
+        """Rebuilds the task data as it was at `moment` (a datetime), or None if that's before any history."""
+        key = moment.strftime(HISTORY_TIME_FORMAT)
+        chunks = self._chunks()
+        index = bisect.bisect_right([start for start, _ in chunks], key) - 1
+        while index >= 0:
+            records = self._read_chunk(chunks[index][1])
+            if records:
+                state = records[0]["snapshot"]
+                for record in records[1:]:
+                    if record["t"] > key:
+                        break
+                    apply_json_ops(state, record["ops"])
+                return state
+            index -= 1  # unreadable chunk: fall back to the one before it
+        return None
+
+    def _read_tail(self, path, offset):
+        """Returns the whole records appended to a plain chunk after byte `offset`, and the offset after them."""
+        records = []
+        with open(path, "rb") as f:
+            f.seek(offset)
+            for line in f:
+                if not line.endswith(b"\n"):
+                    break  # still being written
+                try:
+                    records.append(json.loads(line))
+                except json.JSONDecodeError:
+                    break
+                offset += len(line)
+        return records, offset
+
+    def _latest_state(self):
+        """The task data after the newest record. Only records appended since the last call are replayed."""
+        chunks = self._chunks()
+        if not chunks or not chunks[-1][1].endswith(".jsonl"):
+            self.tail = None
+            return self.state_at(datetime.datetime.now())
+        path = chunks[-1][1]
+        _, offset, state = self.tail if self.tail and self.tail[0] == path else (path, 0, None)
+        try:
+            records, offset = self._read_tail(path, offset)
+        except OSError as e:
+            logging.error(f"Error loading history chunk {path}: {e}")
+            records = []
+        for record in records:
+            if "snapshot" in record:
+                state = record["snapshot"]
+            elif state is not None:
+                apply_json_ops(state, record["ops"])
+        if state is None:
+            # The newest chunk has no snapshot to start from
+            self.tail = None
+            return self.state_at(datetime.datetime.now())
+        self.tail = (path, offset, state)
+        return state
+
+    def daily_completion(self, days):
+        """Returns [(date, completed, total)] for the last `days` days, as things stood at each day's end."""
+        today = datetime.date.today()
+        results = []
+        for offset in range(days - 1, -1, -1):
+            date = today - datetime.timedelta(days=offset)
+            totals = self.completion_cache.get(date)
+            if totals is None:
+                # Finished days can't change any more, so each is only replayed once; today follows the newest deltas
+                state = self._latest_state() if date == today else self.state_at(datetime.datetime.combine(date, datetime.time.max))
+                counts = completion_counts(state).values() if state else []
+                totals = (sum(done for _, done in counts), sum(count for count, _ in counts))
+                if date != today:
+                    self.completion_cache[date] = totals
+            results.append((date, *totals))
+        return results
+
+
+class HistoryDialog(QDialog):
+    """Shows the task data as it was at any chosen moment."""
+    def __init__(self, history, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("Task History")
+        self.setMinimumSize(600, 500)
+        self.history = history
+        layout = QVBoxLayout(self)
+        picker_layout = QHBoxLayout()
+        picker_layout.addWidget(QLabel("Show tasks as they were on:"))
+        self.moment_edit = QDateTimeEdit(QDateTime.currentDateTime())
+        self.moment_edit.setCalendarPopup(True)
+        self.moment_edit.setMaximumDateTime(QDateTime.currentDateTime())
+        self.moment_edit.dateTimeChanged.connect(self._show_moment)
+        picker_layout.addWidget(self.moment_edit)
+        picker_layout.addStretch()
+        layout.addLayout(picker_layout)
+        self.details = QTextEdit(readOnly=True)
+        layout.addWidget(self.details)
+        self._show_moment()
+
+    def _show_moment(self):
+        moment = self.moment_edit.dateTime().toPyDateTime()
+        state = self.history.state_at(moment)
+        heading = moment.strftime("%Y-%m-%d %H:%M")
+        if state is None:
+            self.details.setHtml(f"<h2>{heading}</h2><p>No history was recorded this far back.</p>")
+        else:
+            self.details.setHtml(snapshot_html(heading, state))
+
+
+def data_fingerprint(data):
+    return hashlib.sha256(json.dumps(data, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+class OperationLog:
+    """Undo/redo history kept as the diff_json() ops of each change and of its inverse.
+
+    Undoing or redoing a step replays only its ops, so it costs the size of the
+    change rather than of the data. Steps are evicted oldest first beyond
+    UNDO_MAX_STEPS or UNDO_MAX_BYTES.
+    """
+    def __init__(self):
+        self.undo_steps = collections.deque()
+        self.redo_steps = []
+        self.size = 0
+
+    def _step(self, forward, inverse, sections):
+        return {
+            "forward": forward, "inverse": inverse, "sections": sorted(sections),
+            "size": len(json.dumps([forward, inverse], separators=(",", ":"))), "time": time.time(),
+        }
+
+    @staticmethod
+    def _text_edit_path(ops):
+        if len(ops) == 1 and ops[0][0] == "set" and isinstance(ops[0][2], str):
+            return ops[0][1]
+        return None
+
+    def record(self, forward, inverse, sections):
+        """Adds a change made by the user. `forward` and `inverse` must not share objects with live data."""
+        self.redo_steps.clear()
+        previous = self.undo_steps[-1] if self.undo_steps else None
+        path = self._text_edit_path(forward)
+        if (previous and path is not None and path == self._text_edit_path(previous["forward"])
+                and time.time() - previous["time"] < UNDO_MERGE_MS / 1000):
+            # Typing into one field: keep the first step's inverse, so undo restores the text from before
+            self.undo_steps.pop()
+            self.size -= previous["size"]
+            step = self._step(forward, previous["inverse"], sections)
+        else:
+            step = self._step(forward, inverse, sections)
+        self.undo_steps.append(step)
+        self.size += step["size"]
+        while len(self.undo_steps) > 1 and (len(self.undo_steps) > UNDO_MAX_STEPS or self.size > UNDO_MAX_BYTES):
+            self.size -= self.undo_steps.popleft()["size"]
+
+    def undo(self):
+        """Returns the step to revert (apply its "inverse"), or None."""
+        if not self.undo_steps:
+            return None
+        step = self.undo_steps.pop()
+        self.size -= step["size"]
+        self.redo_steps.append(step)
+        return step
+
+    def redo(self):
+        """Returns the step to re-apply (apply its "forward"), or None."""
+        if not self.redo_steps:
+            return None
+        step = self.redo_steps.pop()
+        self.undo_steps.append(step)
+        self.size += step["size"]
+        return step
+
+    def drop_sections(self, sections):
+        """Forgets steps that can't be replayed after `sections` changed outside the log.
+
+        Ops address list items by position, so the newest step touching those
+        sections goes along with everything older than it.
+        """
+        sections = set(sections)
+        for index in range(len(self.undo_steps) - 1, -1, -1):
+            if sections.intersection(self.undo_steps[index]["sections"]):
+                for _ in range(index + 1):
+                    self.size -= self.undo_steps.popleft()["size"]
+                break
+        self.redo_steps.clear()
+
+    def clear(self):
+        self.undo_steps.clear()
+        self.redo_steps.clear()
+        self.size = 0
+
+    def to_json(self, data):
+        """Returns the log for saving, stamped with the `data` its steps lead up to."""
+        return {"fingerprint": data_fingerprint(data), "undo": list(self.undo_steps), "redo": self.redo_steps}
+
+    @classmethod
+    def from_json(cls, saved, data):
+        """Rebuilds a saved log, or returns an empty one if `data` isn't what it was saved against."""
+        log = cls()
+        if not isinstance(saved, dict) or saved.get("fingerprint") != data_fingerprint(data):
+            return log
+        log.undo_steps.extend(saved.get("undo", []))
+        log.redo_steps = saved.get("redo", [])
+        log.size = sum(step["size"] for step in log.undo_steps)
+        return log
+
+
+def populates_widgets(loader):
+    """Marks a tab loader whose widget updates must not be echoed back into the data by the savers."""
+    @functools.wraps(loader)
+    def wrapper(self, *args, **kwargs):
+        previous, self._populating_widgets = self._populating_widgets, True
+        try:
+            return loader(self, *args, **kwargs)
+        finally:
+            self._populating_widgets = previous
+    return wrapper
+
+
+# --- RPG Radar Chart ---
+RADAR_MAX_VALUE = 10
+RADAR_RING_STEP = 2
+RADAR_ANIMATION_MS = 350
+RADAR_THEMES = {
+    "dark": {"background": "#212121", "text": "#eee", "grid": "#555", "line": "#3f51b5"},
+    "light": {"background": "#f0f0f0", "text": "#111", "grid": "#bbb", "line": "#3f51b5"},
+}
+
+
+class RadarChartWidget(QWidget):
+    """The RPG radar chart, painted directly with QPainter so it stays sharp at any size.
+
+    Everything but the stat polygon and the title (background, grid and labels) is
+    cached as a pixmap per size and theme, so a repaint, including each animation
+    frame between days, is one blit plus one polygon.
+    """
+    def __init__(self, labels, parent=None):
+        super().__init__(parent)
+        self.labels = list(labels)
+        self.values = [0.0] * len(self.labels)
+        self.start_values = list(self.values)
+        self.target_values = list(self.values)
+        self.title = ""
+        self.message = ""
+        self.colors = RADAR_THEMES["dark"]
+        self.layout_cache = None
+        self.static_layer = None
+        self.animation = QVariantAnimation(self)
+        self.animation.setStartValue(0.0)
+        self.animation.setEndValue(1.0)
+        self.animation.setDuration(RADAR_ANIMATION_MS)
+        self.animation.setEasingCurve(QEasingCurve.Type.OutCubic)
+        self.animation.valueChanged.connect(self._on_animation_step)
+
+    def set_theme(self, theme_name):
+        self.colors = RADAR_THEMES.get(theme_name, RADAR_THEMES["dark"])
+        self.static_layer = None
+        self.update()
+
+    def set_message(self, message):
+        """Shows a placeholder text instead of the chart."""
+        self.animation.stop()
+        self.message = message
+        self.update()
+
+    def set_values(self, values, title="", animate=True):
+        self.animation.stop()
+        self.title = title
+        self.start_values = self.values if not self.message else [0.0] * len(self.labels)
+        self.target_values = [min(max(float(v), 0.0), RADAR_MAX_VALUE) for v in values]
+        self.message = ""
+        if animate and self.isVisible():
+            self.animation.start()
+        else:
+            self._on_animation_step(1.0)
+
+    def _on_animation_step(self, progress):
+        self.values = [start + (target - start) * progress for start, target in zip(self.start_values, self.target_values)]
+        self.update()
+
+    def resizeEvent(self, event):
+        self.layout_cache = self.static_layer = None
+        super().resizeEvent(event)
+
+    def changeEvent(self, event):
+        # Font changes (e.g. from a new stylesheet) change the label sizes
+        self.layout_cache = self.static_layer = None
+        super().changeEvent(event)
+
+    def _chart_layout(self):
+        """Returns (center, radius, spoke directions, grid path) for the current size."""
+        if self.layout_cache is None:
+            metrics = self.fontMetrics()
+            label_width = max(metrics.horizontalAdvance(label) for label in self.labels)
+            title_height = metrics.height() * 2
+            center = QPointF(self.width() / 2, (self.height() + title_height) / 2)
+            radius = max(10.0, min(self.width() / 2 - label_width - 12, (self.height() - title_height) / 2 - metrics.height() - 8))
+            count = len(self.labels)
+            directions = [(math.cos(2 * math.pi * i / count), -math.sin(2 * math.pi * i / count)) for i in range(count)]
+            grid = QPainterPath()
+            for ring in range(RADAR_RING_STEP, RADAR_MAX_VALUE + 1, RADAR_RING_STEP):
+                ring_radius = radius * ring / RADAR_MAX_VALUE
+                grid.addEllipse(center, ring_radius, ring_radius)
+            for dx, dy in directions:
+                grid.moveTo(center)
+                grid.lineTo(center.x() + dx * radius, center.y() + dy * radius)
+            self.layout_cache = (center, radius, directions, grid)
+        return self.layout_cache
+
+    def _paint_static_layer(self):
+        center, radius, directions, grid = self._chart_layout()
+        ratio = self.devicePixelRatioF()
+        self.static_layer = QPixmap(round(self.width() * ratio), round(self.height() * ratio))
+        self.static_layer.setDevicePixelRatio(ratio)
+        self.static_layer.fill(QColor(self.colors["background"]))
+        painter = QPainter(self.static_layer)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setFont(self.font())
+        painter.setPen(QPen(QColor(self.colors["grid"]), 1))
+        painter.drawPath(grid)
+
+        painter.setPen(QColor(self.colors["text"]))
+        metrics = self.fontMetrics()
+        # Ring values sit between the first two spokes, like the matplotlib polar axis
+        tick_dx, tick_dy = math.cos(math.pi / 8), -math.sin(math.pi / 8)
+        for ring in range(RADAR_RING_STEP, RADAR_MAX_VALUE + 1, RADAR_RING_STEP):
+            ring_radius = radius * ring / RADAR_MAX_VALUE
+            painter.drawText(QPointF(center.x() + tick_dx * ring_radius + 2, center.y() + tick_dy * ring_radius - 2), str(ring))
+        for (dx, dy), label in zip(directions, self.labels):
+            width, height = metrics.horizontalAdvance(label) + 1, metrics.height()
+            # Anchor each label on the side facing the chart so it grows outwards
+            x = center.x() + dx * (radius + 8) - width / 2 + dx * width / 2
+            y = center.y() + dy * (radius + 8) - height / 2 + dy * height / 2
+            painter.drawText(QRectF(x, y, width, height), Qt.AlignmentFlag.AlignCenter, label)
+        painter.end()
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        text_color = QColor(self.colors["text"])
+        if self.message:
+            painter.fillRect(self.rect(), QColor(self.colors["background"]))
+            painter.setPen(text_color)
+            painter.drawText(QRectF(self.rect()), Qt.AlignmentFlag.AlignCenter | Qt.TextFlag.TextWordWrap, self.message)
+            return
+        if self.static_layer is None:
+            self._paint_static_layer()
+        painter.drawPixmap(0, 0, self.static_layer)
+
+        center, radius, directions, _ = self._chart_layout()
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        line_color = QColor(self.colors["line"])
+        fill_color = QColor(line_color)
+        fill_color.setAlphaF(0.25)
+        scale = radius / RADAR_MAX_VALUE
+        polygon = QPolygonF([QPointF(center.x() + dx * scale * value, center.y() + dy * scale * value)
+                             for (dx, dy), value in zip(directions, self.values)])
+        painter.setPen(QPen(line_color, 2))
+        painter.setBrush(fill_color)
+        painter.drawPolygon(polygon)
+
+        title_font = QFont(self.font())
+        title_font.setPointSizeF(title_font.pointSizeF() * 1.4)
+        title_font.setBold(True)
+        painter.setFont(title_font)
+        painter.setPen(text_color)
+        painter.drawText(QRectF(0, 0, self.width(), self.fontMetrics().height() * 2), Qt.AlignmentFlag.AlignCenter, self.title)
+
+
+# --- RPG Trend Charts ---
+TREND_COLORS = ["#e55039", "#4a69bd", "#f6b93b", "#78e08f", "#b33771", "#38ada9", "#fa983a", "#9c88ff", "#f8c291"]
+TREND_MIN_SPAN_DAYS = 7
+TREND_PIXELS_PER_BUCKET = 2
+TREND_PYRAMID_MIN_BUCKETS = 64
+HEATMAP_MIN_CELL_PITCH = 15
+HEATMAP_MAX_CELL_PITCH = 28
+HEATMAP_CELL_GAP = 2
+
+
+def build_minmax_pyramid(xs, ys):
+    """Downsamples a series into levels for drawing at any zoom.
+
+    Level 0 is the raw series. Level k covers 2**k raw points per bucket and keeps
+    only each bucket's lowest and highest point (in x order), so peaks and dips
+    survive at every level while the total size stays under twice the input.
+    """
+    levels = [(list(xs), list(ys))]
+    buckets = [[(x, y)] for x, y in zip(xs, ys)]
+    while len(buckets) > TREND_PYRAMID_MIN_BUCKETS:
+        merged = []
+        for i in range(0, len(buckets), 2):
+            points = buckets[i] + buckets[i + 1] if i + 1 < len(buckets) else buckets[i]
+            low = min(points, key=lambda point: point[1])
+            high = max(points, key=lambda point: point[1])
+            merged.append(sorted({low, high}))
+        buckets = merged
+        levels.append(([p[0] for b in buckets for p in b], [p[1] for b in buckets for p in b]))
+    return levels
+
+
+def _rpg_history_points(history):
+    """Returns [(day ordinal, stats dict)] sorted by date, skipping keys that aren't ISO dates."""
+    points = []
+    for date, stats in history.items():
+        try:
+            points.append((datetime.date.fromisoformat(date).toordinal(), stats))
+        except (TypeError, ValueError):
+            logging.warning(f"Ignoring RPG entry with an invalid date: {date!r}")
+    return sorted(points, key=lambda point: point[0])
+
+
+def clean_rpg_history(history):
+    """Keeps the entries of a parsed progress_data.json that map an ISO date to a dict of stats."""
+    if not isinstance(history, dict):
+        return {}
+    clean = {}
+    for date, stats in history.items():
+        if is_iso_date(date) and isinstance(stats, dict):
+            clean[date] = stats
+        else:
+            logging.warning(f"Ignoring RPG entry that isn't a day's stats: {date!r}")
+    return clean
+
+
+def build_trend_series(history, keys):
+    """Reduces an RPG history to what TrendChartWidget draws: (a min/max pyramid per stat, x range, points per day).
+
+    It touches no widgets, so profiles prepare it on their loader thread.
+    """
+    points = _rpg_history_points(history)
+    xs = [x for x, _ in points]
+    pyramids = {key: build_minmax_pyramid(xs, [float(stats.get(key, 0)) for _, stats in points]) for key in keys}
+    x_range = (xs[0], xs[-1]) if xs else None
+    points_per_day = len(xs) / (xs[-1] - xs[0] + 1) if xs else 1.0
+    return pyramids, x_range, points_per_day
+
+
+class TrendChartWidget(QWidget):
+    """Line chart of every RPG stat over the whole history. Wheel zooms, drag pans,
+    double-click resets, and clicking a legend entry hides or shows that stat.
+
+    Each series is reduced once into a min/max pyramid, so a zoom only slices the
+    visible part of the level giving about one bucket per couple of pixels instead
+    of re-plotting every logged day. The plotted lines are kept in a pixmap, and a
+    pan shifts that pixmap and draws just the strip that scrolled into view.
+    """
+    def __init__(self, keys, parent=None):
+        super().__init__(parent)
+        self.keys = list(keys)
+        self.hidden_keys = set()
+        self.pyramids = {}
+        self.points_per_day = 1.0
+        self.x_range = None
+        self.view = None
+        self.drag_origin = None
+        self.legend_rects = {}
+        self.colors = RADAR_THEMES["dark"]
+        self.series_layer = None
+        self.series_layer_view = None
+
+    def set_theme(self, theme_name):
+        self.colors = RADAR_THEMES.get(theme_name, RADAR_THEMES["dark"])
+        self.series_layer = None
+        self.update()
+
+    def set_history(self, history):
+        self.set_series(build_trend_series(history, self.keys))
+
+    def set_series(self, series):
+        """Shows a history already reduced by build_trend_series()."""
+        self.pyramids, x_range, self.points_per_day = series
+        if x_range != self.x_range:
+            self.x_range = x_range
+            self._reset_view()
+        self.series_layer = None
+        self.update()
+
+    def resizeEvent(self, event):
+        self.series_layer = None
+        super().resizeEvent(event)
+
+    def _reset_view(self):
+        if self.x_range:
+            first, last = self.x_range
+            padding = max(TREND_MIN_SPAN_DAYS - (last - first), 0) / 2
+            self.view = (first - padding, last + padding)
+        else:
+            self.view = None
+
+    def _set_view(self, x_min, x_max):
+        first, last = self.x_range
+        max_span = max(last - first, TREND_MIN_SPAN_DAYS)
+        span = min(max(x_max - x_min, TREND_MIN_SPAN_DAYS), max_span)
+        # Keep at least part of the history on screen
+        x_min = min(max(x_min, first - span / 2), last - span / 2)
+        self.view = (x_min, x_min + span)
+        self.update()
+
+    def _plot_rect(self):
+        metrics = self.fontMetrics()
+        return QRectF(32, metrics.height() + 16, max(self.width() - 44, 1), max(self.height() - 2 * metrics.height() - 28, 1))
+
+    def _x_at(self, pixel_x):
+        plot, (x_min, x_max) = self._plot_rect(), self.view
+        return x_min + (pixel_x - plot.left()) / plot.width() * (x_max - x_min)
+
+    def _level_for_span(self, span, plot_width):
+        # Chosen from the span alone (not the exact points on screen) so it stays put while panning
+        visible = span * self.points_per_day
+        target = max(plot_width / TREND_PIXELS_PER_BUCKET, 1)
+        return math.ceil(math.log2(visible / target)) if visible > target else 0
+
+    def _draw_series(self, painter, plot_size, x_min, x_max, x_from, x_to):
+        """Draws each shown stat between days x_from and x_to, in coordinates of a plot showing x_min..x_max."""
+        x_scale = plot_size.width() / (x_max - x_min)
+        y_scale = plot_size.height() / RADAR_MAX_VALUE
+        level = self._level_for_span(x_max - x_min, plot_size.width())
+        for key, color in zip(self.keys, TREND_COLORS):
+            if key in self.hidden_keys:
+                continue
+            levels = self.pyramids[key]
+            xs, ys = levels[min(level, len(levels) - 1)]
+            # One point either side so lines run off the edges instead of stopping short
+            start = max(bisect.bisect_left(xs, x_from) - 1, 0)
+            end = bisect.bisect_right(xs, x_to) + 1
+            polyline = QPolygonF([QPointF((x - x_min) * x_scale, plot_size.height() - y * y_scale)
+                                  for x, y in zip(xs[start:end], ys[start:end])])
+            # A hairline pen: wider antialiased strokes get very slow on dense, jagged lines
+            painter.setPen(QPen(QColor(color), 1))
+            if polyline.count() == 1:
+                painter.drawEllipse(polyline.at(0), 2.5, 2.5)
+            else:
+                painter.drawPolyline(polyline)
+
+    def _series_layer_for(self, plot):
+        x_min, x_max = self.view
+        size = plot.size().toSize()
+        previous, previous_view = self.series_layer, self.series_layer_view
+        shift = 0.0
+        if previous is not None and previous_view[1] - previous_view[0] == x_max - x_min:
+            shift = (previous_view[0] - x_min) * plot.width() / (x_max - x_min)
+            if shift == 0:
+                return previous
+            if abs(shift) >= plot.width():
+                previous = None
+        else:
+            previous = None
+
+        ratio = self.devicePixelRatioF()
+        layer = QPixmap(round(size.width() * ratio), round(size.height() * ratio))
+        layer.setDevicePixelRatio(ratio)
+        layer.fill(Qt.GlobalColor.transparent)
+        painter = QPainter(layer)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        if previous is None:
+            self._draw_series(painter, plot.size(), x_min, x_max, x_min, x_max)
+        else:
+            painter.drawPixmap(QPointF(shift, 0), previous)
+            days_per_pixel = (x_max - x_min) / plot.width()
+            if shift > 0:
+                strip, x_from, x_to = QRectF(0, 0, shift, plot.height()), x_min, x_min + shift * days_per_pixel
+            else:
+                strip, x_from, x_to = QRectF(plot.width() + shift, 0, -shift, plot.height()), x_max + shift * days_per_pixel, x_max
+            painter.setClipRect(strip)
+            self._draw_series(painter, plot.size(), x_min, x_max, x_from, x_to)
+        painter.end()
+        self.series_layer, self.series_layer_view = layer, self.view
+        return layer
+
+    def wheelEvent(self, event):
+        if not self.view:
+            return
+        x_min, x_max = self.view
+        anchor = self._x_at(event.position().x())
+        factor = 0.8 if event.angleDelta().y() > 0 else 1.25
+        new_min = anchor - (anchor - x_min) * factor
+        self._set_view(new_min, new_min + (x_max - x_min) * factor)
+
+    def mousePressEvent(self, event):
+        for key, rect in self.legend_rects.items():
+            if rect.contains(event.position()):
+                self.hidden_keys.symmetric_difference_update({key})
+                self.series_layer = None
+                self.update()
+                return
+        if self.view:
+            self.drag_origin = (event.position().x(), self.view)
+
+    def mouseMoveEvent(self, event):
+        if self.drag_origin:
+            origin_x, (x_min, x_max) = self.drag_origin
+            # Whole pixels only, so the cached lines can be shifted without resampling
+            shift = round(origin_x - event.position().x()) / self._plot_rect().width() * (x_max - x_min)
+            self._set_view(x_min + shift, x_max + shift)
+
+    def mouseReleaseEvent(self, event):
+        self.drag_origin = None
+
+    def mouseDoubleClickEvent(self, event):
+        self._reset_view()
+        self.update()
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.fillRect(self.rect(), QColor(self.colors["background"]))
+        text_color, grid_color = QColor(self.colors["text"]), QColor(self.colors["grid"])
+        if not self.view:
+            painter.setPen(text_color)
+            painter.drawText(QRectF(self.rect()), Qt.AlignmentFlag.AlignCenter, "Log your first day of stats to see your trends!")
+            return
+
+        metrics = self.fontMetrics()
+        plot = self._plot_rect()
+        x_min, x_max = self.view
+        x_scale = plot.width() / (x_max - x_min)
+        y_scale = plot.height() / RADAR_MAX_VALUE
+
+        painter.setPen(QPen(grid_color, 1))
+        for value in range(0, RADAR_MAX_VALUE + 1, RADAR_RING_STEP):
+            y = plot.bottom() - value * y_scale
+            painter.drawLine(QPointF(plot.left(), y), QPointF(plot.right(), y))
+        painter.setPen(text_color)
+        for value in range(0, RADAR_MAX_VALUE + 1, RADAR_RING_STEP):
+            painter.drawText(QRectF(0, plot.bottom() - value * y_scale - metrics.height() / 2, plot.left() - 6, metrics.height()),
+                             Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter, str(value))
+
+        # Date ticks: the smallest step that leaves room for each label
+        span = x_max - x_min
+        label_format = "%b %d" if span <= 120 else "%b %Y"
+        max_ticks = max(int(plot.width() // 90), 1)
+        step = next((days for days in (1, 2, 7, 14, 30, 61, 91, 182, 365, 730, 1825) if span / days <= max_ticks), 3650)
+        tick = math.ceil(x_min / step) * step
+        while tick <= x_max:
+            x = plot.left() + (tick - x_min) * x_scale
+            label = datetime.date.fromordinal(int(tick)).strftime(label_format)
+            if metrics.horizontalAdvance(label) / 2 <= self.width() - x:
+                painter.drawText(QRectF(x - 45, plot.bottom() + 4, 90, metrics.height()), Qt.AlignmentFlag.AlignCenter, label)
+            tick += step
+
+        painter.drawPixmap(plot.topLeft(), self._series_layer_for(plot))
+
+        self.legend_rects = {}
+        x = plot.left()
+        for key, color in zip(self.keys, TREND_COLORS):
+            width = metrics.horizontalAdvance(key) + 20
+            rect = QRectF(x, 4, width, metrics.height())
+            painter.fillRect(QRectF(x, 4 + metrics.height() / 2 - 5, 10, 10), QColor(grid_color if key in self.hidden_keys else color))
+            painter.setPen(grid_color if key in self.hidden_keys else text_color)
+            painter.drawText(rect.adjusted(14, 0, 0, 0), Qt.AlignmentFlag.AlignVCenter, key)
+            self.legend_rects[key] = rect
+            x += width + 8
+
+
+class CalendarHeatmapWidget(QWidget):
+    """A week-by-weekday calendar of one RPG stat (or the daily total), newest week
+    on the right. Wheel or drag scrolls back through older weeks; only the weeks
+    on screen are ever looked at.
+    """
+    WEEKDAY_LABELS = {0: "Mon", 2: "Wed", 4: "Fri"}
+
+    def __init__(self, keys, parent=None):
+        super().__init__(parent)
+        self.keys = list(keys)
+        self.metric = None
+        self.history = {}
+        self.values = {}
+        self.last_week = None
+        self.first_week = None
+        self.weeks_back = 0
+        self.drag_origin = None
+        self.colors = RADAR_THEMES["dark"]
+        self.setMouseTracking(True)
+
+    def set_theme(self, theme_name):
+        self.colors = RADAR_THEMES.get(theme_name, RADAR_THEMES["dark"])
+        self.update()
+
+    def set_history(self, history):
+        self.history = history
+        self._compute_values()
+
+    def set_metric(self, key):
+        """Shows one stat, or the total of all stats when `key` is None."""
+        self.metric = key
+        self._compute_values()
+
+    def _compute_values(self):
+        self.values = {}
+        for ordinal, stats in _rpg_history_points(self.history):
+            if self.metric:
+                self.values[ordinal] = stats.get(self.metric, 0)
+            else:
+                self.values[ordinal] = sum(stats.get(key, 0) for key in self.keys)
+        if self.values:
+            first, last = min(self.values), max(self.values)
+            self.first_week, self.last_week = first - (first - 1) % 7, last - (last - 1) % 7
+        else:
+            self.first_week = self.last_week = None
+        self.weeks_back = 0
+        self.update()
+
+    def _grid_origin(self):
+        metrics = self.fontMetrics()
+        return metrics.horizontalAdvance("Wed") + 8, metrics.height() + 8
+
+    def _cell_pitch(self):
+        _, top = self._grid_origin()
+        return min(max(int((self.height() - top) // 7), HEATMAP_MIN_CELL_PITCH), HEATMAP_MAX_CELL_PITCH)
+
+    def _visible_weeks(self):
+        left, _ = self._grid_origin()
+        return max(int((self.width() - left) // self._cell_pitch()), 1)
+
+    def _scroll(self, weeks):
+        max_back = max((self.last_week - self.first_week) // 7 + 1 - self._visible_weeks(), 0)
+        self.weeks_back = min(max(self.weeks_back + weeks, 0), max_back)
+        self.update()
+
+    def _ordinal_at(self, pos):
+        left, top = self._grid_origin()
+        pitch = self._cell_pitch()
+        column, row = int((pos.x() - left) // pitch), int((pos.y() - top) // pitch)
+        if not (0 <= row < 7 and 0 <= column < self._visible_weeks()):
+            return None
+        return self.last_week - (self._visible_weeks() - 1 - column + self.weeks_back) * 7 + row
+
+    def wheelEvent(self, event):
+        if self.last_week is not None:
+            self._scroll(4 if event.angleDelta().y() > 0 else -4)
+
+    def mousePressEvent(self, event):
+        self.drag_origin = (event.position().x(), self.weeks_back)
+
+    def mouseMoveEvent(self, event):
+        if self.drag_origin and self.last_week is not None:
+            origin_x, origin_weeks = self.drag_origin
+            weeks = round((event.position().x() - origin_x) / self._cell_pitch())
+            self._scroll(origin_weeks + weeks - self.weeks_back)
+        elif self.last_week is not None:
+            ordinal = self._ordinal_at(event.position())
+            if ordinal in self.values:
+                date = datetime.date.fromordinal(ordinal).isoformat()
+                self.setToolTip(f"{date}: {self.values[ordinal]} {self.metric or 'total'}")
+            else:
+                self.setToolTip("")
+
+    def mouseReleaseEvent(self, event):
+        self.drag_origin = None
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.fillRect(self.rect(), QColor(self.colors["background"]))
+        text_color = QColor(self.colors["text"])
+        painter.setPen(text_color)
+        if self.last_week is None:
+            painter.drawText(QRectF(self.rect()), Qt.AlignmentFlag.AlignCenter, "Log your first day of stats to see your calendar!")
+            return
+
+        metrics = self.fontMetrics()
+        left, top = self._grid_origin()
+        pitch = self._cell_pitch()
+        cell_size = pitch - HEATMAP_CELL_GAP
+        for row, label in self.WEEKDAY_LABELS.items():
+            painter.drawText(QRectF(0, top + row * pitch, left - 6, cell_size),
+                             Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter, label)
+
+        empty_color = QColor(self.colors["grid"])
+        empty_color.setAlphaF(0.35)
+        # Shade relative to the best day on record so the calendar keeps its contrast
+        max_value = max(max(self.values.values()), 1)
+        weeks = self._visible_weeks()
+        previous_month = None
+        for column in range(weeks):
+            week = self.last_week - (weeks - 1 - column + self.weeks_back) * 7
+            x = left + column * pitch
+            month = datetime.date.fromordinal(week).month
+            if month != previous_month and column < weeks - 2:
+                painter.setPen(text_color)
+                painter.drawText(QPointF(x, metrics.ascent() + 2), datetime.date.fromordinal(week).strftime("%b"))
+            previous_month = month
+            for row in range(7):
+                value = self.values.get(week + row)
+                if value is None:
+                    color = empty_color
+                else:
+                    color = QColor(self.colors["line"])
+                    color.setAlphaF(0.15 + 0.85 * min(value / max_value, 1.0))
+                painter.fillRect(QRectF(x, top + row * pitch, cell_size, cell_size), color)
+
+
+# --- RPG Experience ---
+XP_PER_POINT = 10
+# Each further day of an unbroken logging streak adds this much to the day's XP, up to the cap
+STREAK_BONUS_STEP = 0.05
+STREAK_BONUS_CAP = 0.5
+# Reaching level L takes base * (L - 1) ** exponent XP in total; settings.json can override it as "level_curve"
+DEFAULT_LEVEL_CURVE = {"base": 100, "exponent": 1.5}
+RPG_ACHIEVEMENTS = {
+    "first_log": ("First Steps", "Log your stats for the first time"),
+    "streak_7": ("On a Roll", "Log 7 days in a row"),
+    "streak_30": ("Unstoppable", "Log 30 days in a row"),
+    "days_100": ("Centurion", "Log 100 days"),
+    "perfect_day": ("Perfect Day", "Score 10 in every stat on one day"),
+    "level_5": ("Adept", "Reach level 5 in any stat"),
+    "level_10": ("Master", "Reach level 10 in any stat"),
+    "all_level_5": ("Well-Rounded", "Reach level 5 in every stat"),
+}
+
+
+def level_curve(settings):
+    curve = settings.get("level_curve")
+    if isinstance(curve, dict) and all(isinstance(curve.get(key), (int, float)) and curve[key] > 0 for key in DEFAULT_LEVEL_CURVE):
+        return {key: curve[key] for key in DEFAULT_LEVEL_CURVE}
+    return dict(DEFAULT_LEVEL_CURVE)
+
+
+def xp_for_level(level, curve):
+    return curve["base"] * (level - 1) ** curve["exponent"]
+
+
+def level_for_xp(xp, curve):
+    """Returns (level, XP earned within it, XP the level takes to complete)."""
+    level = int((xp / curve["base"]) ** (1 / curve["exponent"])) + 1
+    # The closed form can land one off at exact boundaries
+    while xp_for_level(level + 1, curve) <= xp:
+        level += 1
+    while level > 1 and xp_for_level(level, curve) > xp:
+        level -= 1
+    floor = xp_for_level(level, curve)
+    return level, xp - floor, xp_for_level(level + 1, curve) - floor
+
+
+class XpEngine:
+    """Cumulative XP per stat, the logging streak and achievements, over the RPG history.
+
+    A checkpoint of the running totals is kept after every logged day, so logging or
+    correcting the latest day is one day's work, and correcting an older day only
+    replays the days from it onwards.
+    """
+    def __init__(self, stat_keys, curve=None):
+        self.stat_keys = list(stat_keys)
+        self.curve = curve or dict(DEFAULT_LEVEL_CURVE)
+        self.dates = []
+        # (XP per stat, streak, days logged) as of the end of each of self.dates
+        self.checkpoints = []
+        # achievement id -> date it was unlocked
+        self.achievements = {}
+
+    @classmethod
+    def from_history(cls, history, stat_keys, curve=None):
+        engine = cls(stat_keys, curve)
+        engine._replay(history, "", sorted(history))
+        return engine
+
+    def set_curve(self, curve, history):
+        """Levels gate some achievements, so a new curve means replaying the history once. Returns whether it changed."""
+        if curve == self.curve:
+            return False
+        self.curve = curve
+        self._replay(history, "", sorted(history))
+        return True
+
+    def update(self, history, date):
+        """Catches up after the one day `date` was logged, corrected or removed.
+        Returns the ids of the achievements that unlocked."""
+        later = self.dates[bisect.bisect_right(self.dates, date):]
+        return self._replay(history, date, ([date] if date in history else []) + later)
+
+    def sync(self, old_history, history):
+        """Catches up with a history changed elsewhere, replaying from the earliest day that differs."""
+        changed = [day for day in set(old_history) | set(history) if old_history.get(day) != history.get(day)]
+        if not changed:
+            return []
+        earliest = min(changed)
+        return self._replay(history, earliest, sorted(day for day in history if day >= earliest))
+
+    def _replay(self, history, date, days):
+        index = bisect.bisect_left(self.dates, date)
+        del self.dates[index:], self.checkpoints[index:]
+        unlocked_before = set(self.achievements)
+        self.achievements = {key: day for key, day in self.achievements.items() if day < date}
+        for day in days:
+            self._add_day(day, history[day])
+        return [key for key in self.achievements if key not in unlocked_before]
+
+    def _points(self, stats, key):
+        value = stats.get(key, 0) if isinstance(stats, dict) else 0
+        return value if isinstance(value, (int, float)) else 0
+
+    def _add_day(self, date, stats):
+        xp, streak, days = self.checkpoints[-1] if self.checkpoints else ((0,) * len(self.stat_keys), 0, 0)
+        points = [self._points(stats, key) for key in self.stat_keys]
+        if any(points):
+            yesterday = (datetime.date.fromisoformat(date) - datetime.timedelta(days=1)).isoformat()
+            streak = streak + 1 if self.dates and self.dates[-1] == yesterday else 1
+            days += 1
+        else:
+            streak = 0
+        bonus = 1 + min((streak - 1) * STREAK_BONUS_STEP, STREAK_BONUS_CAP) if streak else 1
+        xp = tuple(total + round(value * XP_PER_POINT * bonus) for total, value in zip(xp, points))
+        self.dates.append(date)
+        self.checkpoints.append((xp, streak, days))
+
+        levels = [level_for_xp(total, self.curve)[0] for total in xp]
+        reached = {
+            "first_log": days >= 1, "streak_7": streak >= 7, "streak_30": streak >= 30, "days_100": days >= 100,
+            "perfect_day": bool(points) and min(points) >= RADAR_MAX_VALUE,
+            "level_5": max(levels, default=0) >= 5, "level_10": max(levels, default=0) >= 10,
+            "all_level_5": bool(levels) and min(levels) >= 5,
+        }
+        for key, done in reached.items():
+            if done and key not in self.achievements:
+                self.achievements[key] = date
+
+    def totals(self):
+        """XP per stat key."""
+        xp = self.checkpoints[-1][0] if self.checkpoints else (0,) * len(self.stat_keys)
+        return dict(zip(self.stat_keys, xp))
+
+    def current_streak(self, today):
+        """The streak still alive on `today`: it survives until a whole day goes unlogged."""
+        if not self.dates:
+            return 0
+        yesterday = (datetime.date.fromisoformat(today) - datetime.timedelta(days=1)).isoformat()
+        return self.checkpoints[-1][1] if self.dates[-1] >= yesterday else 0
+
+
+# --- Profiles ---
+def profile_directory(name):
+    return DEFAULT_PROFILE_DIR if name == DEFAULT_PROFILE else os.path.join(PROFILES_DIR, name)
+
+
+def list_profiles():
+    names = [entry.name for entry in os.scandir(PROFILES_DIR) if entry.is_dir()] if os.path.isdir(PROFILES_DIR) else []
+    return [DEFAULT_PROFILE] + sorted(name for name in names if name.casefold() != DEFAULT_PROFILE.casefold())
+
+
+class ProfileState:
+    """Everything one profile has loaded: its synced files, parsed data, history and RPG chart series.
+
+    It holds no widgets, so load_profile() can build it on a worker thread.
+    """
+    def __init__(self, name, directory):
+        self.name = name
+        self.directory = directory
+        os.makedirs(os.path.join(directory, os.path.dirname(RPG_DATA_FILE)), exist_ok=True)
+        os.makedirs(os.path.join(directory, os.path.dirname(RPG_WALLPAPER_FILE)), exist_ok=True)
+        self.data_file = SyncedJsonFile(os.path.join(directory, DATA_FILE))
+        self.settings_file = SyncedJsonFile(os.path.join(directory, SETTINGS_FILE))
+        self.rpg_data_file = SyncedJsonFile(os.path.join(directory, RPG_DATA_FILE))
+        self.wallpaper_file = os.path.join(directory, RPG_WALLPAPER_FILE)
+        self.history = HistoryStore(os.path.join(directory, HISTORY_DIR))
+        self.archive = DailyArchive(os.path.join(directory, ARCHIVE_DIR))
+        self.undo_file = SyncedJsonFile(os.path.join(directory, UNDO_FILE))
+        self.recurring = RecurringTasks(os.path.join(directory, RECURRING_FILE))
+        self.data = None
+        self.settings = None
+        # The data as of the last collected change; each new change is diffed against it for history and undo
+        self.change_base = None
+        self.undo_log = OperationLog()
+        self.rpg_history = {}
+        # build_trend_series() of rpg_history; reset to None whenever rpg_history changes
+        self.trend_series = None
+        # XpEngine over rpg_history, updated in place whenever a day is logged
+        self.xp = None
+
+
+# Each of these reads one of a profile's files and touches nothing else, so they can run concurrently
+def _clean_task(task, todo=False):
+    """Returns a copy of `task` with a string title and a bool done, or None if it can't be one."""
+    if not isinstance(task, dict) or not isinstance(task.get("title", ""), str):
+        return None
+    clean = {**task, "title": task.get("title", ""), "done": bool(task.get("done", False))}
+    if todo and clean.get("priority") not in TODO_PRIORITIES:
+        clean["priority"] = "Medium"
+    return clean
+
+
+def clean_task_data(data, default_data):
+    """Returns `data` shaped like `default_data`, so the tab loaders can rely on it.
+
+    Sections and fields of the wrong type are reset, entries that aren't tasks are
+    dropped, and fixed-slot lists (3/3/3, Ivy Lee) are padded or cut to their slots.
+    """
+    clean = dict(data)
+    for section, default in default_data.items():
+        value = data.get(section)
+        if not isinstance(value, dict):
+            clean[section] = copy.deepcopy(default)
+            continue
+        clean[section] = dict(value)
+        for key, default_value in default.items():
+            item = value.get(key)
+            if isinstance(default_value, list):
+                tasks = [_clean_task(task, section == "Todo List") for task in item] if isinstance(item, list) else []
+                tasks = [task for task in tasks if task is not None]
+                if default_value:
+                    tasks = (tasks + copy.deepcopy(default_value))[:len(default_value)]
+                clean[section][key] = tasks
+            elif isinstance(default_value, dict):
+                clean[section][key] = _clean_task(item) or copy.deepcopy(default_value)
+            elif type(item) is not type(default_value):
+                clean[section][key] = default_value
+    return clean
+
+
+def load_profile_data(state, default_data):
+    """Returns the validated task data, a copy of it to diff changes against, and the saved undo log.
+    Also reads the recurring rules, which belong with the data."""
+    loaded = state.data_file.load(default_data)
+    data = clean_task_data(loaded, default_data)
+    if data != loaded:
+        logging.warning(f"Repaired malformed entries in {state.data_file.file_path}")
+    state.recurring.load()
+    with state.undo_file.locked():
+        saved_log = state.undo_file.read()
+    undo_log = OperationLog.from_json(saved_log, data) if saved_log is not None else OperationLog()
+    return data, copy.deepcopy(data), undo_log
+
+
+def load_profile_settings(state):
+    return state.settings_file.load({"theme": "dark"})
+
+
+def load_profile_rpg(state, stat_keys):
+    """Returns the RPG history, its build_trend_series() and its XpEngine (on the default level curve)."""
+    with state.rpg_data_file.locked():
+        history = clean_rpg_history(state.rpg_data_file.read())
+    return history, build_trend_series(history, stat_keys), XpEngine.from_history(history, stat_keys)
+
+
+def load_profile(name, default_data, stat_keys):
+    """Reads a whole profile from disk and prepares its chart series. Safe to call off the UI thread."""
+    state = ProfileState(name, profile_directory(name))
+    state.data, state.change_base, state.undo_log = load_profile_data(state, default_data)
+    state.settings = load_profile_settings(state)
+    state.rpg_history, state.trend_series, state.xp = load_profile_rpg(state, stat_keys)
+    state.xp.set_curve(level_curve(state.settings), state.rpg_history)
+    return state
+
+
+class ProfileCache:
+    """The most recently used profiles, at most `capacity` of them.
 
-# --- RPG Tracker Paths ---
-RPG_DATA_DIR = os.path.join(SCRIPT_DIR, "stats")
-RPG_WALLPAPER_DIR = os.path.join(SCRIPT_DIR, "Wallpaper")
-RPG_DATA_FILE = os.path.join(RPG_DATA_DIR, "progress_data.json")
-RPG_WALLPAPER_FILE = os.path.join(RPG_WALLPAPER_DIR, "wallpaper.png")
+    Profiles are saved when switched away from, so an evicted one loses nothing and
+    memory stays the same however many profiles exist.
+    """
+    def __init__(self, capacity=PROFILE_CACHE_SIZE):
+        self.capacity = capacity
+        self.states = collections.OrderedDict()
+
+    def get(self, name):
+        state = self.states.get(name)
+        if state is not None:
+            self.states.move_to_end(name)
+        return state
+
+    def put(self, state):
+        self.states[state.name] = state
+        self.states.move_to_end(state.name)
+        while len(self.states) > self.capacity:
+            self.states.popitem(last=False)
+
+
+class ProfileLoader(QObject):
+    """Loads profiles on worker threads. `loaded` delivers (name, finished future) and
+    `part_loaded` (part, finished future) on the UI thread."""
+    loaded = pyqtSignal(str, object)
+    part_loaded = pyqtSignal(str, object)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        # One thread per file, so the startup load reads all of them at once
+        self.executor = concurrent.futures.ThreadPoolExecutor(max_workers=len(STARTUP_PART_TABS), thread_name_prefix="profile-loader")
+        self.pending = set()
+
+    def request_parts(self, state, default_data, stat_keys):
+        """Loads each of a profile's files separately, so each can be shown as soon as it is ready."""
+        parts = {
+            "data": (load_profile_data, state, default_data),
+            "settings": (load_profile_settings, state),
+            "rpg": (load_profile_rpg, state, stat_keys),
+        }
+        for part, (function, *args) in parts.items():
+            future = self.executor.submit(function, *args)
+            future.add_done_callback(lambda done, part=part: self.part_loaded.emit(part, done))
+
+    def request(self, name, default_data, stat_keys):
+        if name in self.pending:
+            return
+        self.pending.add(name)
+        future = self.executor.submit(load_profile, name, default_data, stat_keys)
+        future.add_done_callback(lambda done: self.loaded.emit(name, done))
+
+    def shutdown(self):
+        self.executor.shutdown(wait=True, cancel_futures=True)
+
+
+def _profile_attribute(name):
+    """An app attribute that lives on the active ProfileState, so switching profiles swaps it everywhere."""
+    return property(lambda self: getattr(self.profile, name), lambda self, value: setattr(self.profile, name, value))
 
-# --- Create RPG Directories ---
-os.makedirs(RPG_DATA_DIR, exist_ok=True)
-os.makedirs(RPG_WALLPAPER_DIR, exist_ok=True)
 
 class EditTaskDialog(QDialog):
     """A dialog for editing the text of a task."""
@@ -62,20 +2207,35 @@ class EditTaskDialog(QDialog):
 
 class ProductivityApp(QMainWindow):
     """The main application window for the Productivity Tracker."""
+    # Per-profile state, all swapped at once by _activate_profile()
+    data = _profile_attribute("data")
+    settings = _profile_attribute("settings")
+    data_file = _profile_attribute("data_file")
+    settings_file = _profile_attribute("settings_file")
+    rpg_data_file = _profile_attribute("rpg_data_file")
+    rpg_history = _profile_attribute("rpg_history")
+    history = _profile_attribute("history")
+    change_base = _profile_attribute("change_base")
+    undo_log = _profile_attribute("undo_log")
+    archive = _profile_attribute("archive")
+
     def __init__(self):
         super().__init__()
-        self.setWindowTitle("Personal Growth Dashboard")
         self.setGeometry(100, 100, 1200, 800)
 
-        # Productivity Data
-        self.data = self._load_json(DATA_FILE, self._get_default_data())
-        self.settings = self._load_json(SETTINGS_FILE, {"theme": "dark"})
+        # Each section's version is bumped on change; a tab reloads only if it last rendered an older one
+        self.data_versions = {}
+        self.rendered_versions = {}
+        self._populating_widgets = False
         self.pomodoro_time = 25 * 60
         self.pomodoro_timer_running = False
         self.task_widgets = {}
+        self.list_fill_generations = {}
 
         # RPG Stats Data
         self.rpg_widgets = {}
+        self.rpg_dates = []
+        self.rpg_day_index = -1
         self.STATS = {
             "ATK": "Strength Training", "DEF": "Bodybuilding & Health",
             "CHA": "People Skills", "INT": "Books & Learning",
@@ -84,6 +2244,55 @@ class ProductivityApp(QMainWindow):
             "GOLD": "Finance & Resources"
         }
 
+        # Profiles
+        os.makedirs(PROFILES_DIR, exist_ok=True)
+        self.profiles_file = SyncedJsonFile(PROFILES_FILE)
+        active_profile = self.profiles_file.load({"active": DEFAULT_PROFILE})["active"]
+        if active_profile not in list_profiles():
+            active_profile = DEFAULT_PROFILE
+        # The window is built around defaults and filled in as the files are read (see _start_loading)
+        self.profile = ProfileState(active_profile, profile_directory(active_profile))
+        self.profile.data = self._get_default_data()
+        self.profile.settings = {"theme": "dark"}
+        self.profile.xp = XpEngine(self.STATS)
+        self.profile.change_base = copy.deepcopy(self.profile.data)
+        self.loading_parts = set(STARTUP_PART_TABS)
+        # Files that failed to load; the app carries on with their defaults
+        self.unreadable_files = []
+        self.profile_cache = ProfileCache()
+        self.profile_cache.put(self.profile)
+        self.pending_profile = None
+        self.profile_loader = ProfileLoader(self)
+        self.profile_loader.loaded.connect(self._on_profile_loaded)
+        self.profile_loader.part_loaded.connect(self._on_startup_part_loaded)
+        self._update_window_title()
+
+        # Local API
+        self.api_server = None
+        self.api_dirty_sections = set()
+        self.api_bridge = ApiBridge(self)
+        self.api_bridge.batch_requested.connect(self._apply_api_batch)
+        self.api_publish_timer = QTimer(self)
+        self.api_publish_timer.setSingleShot(True)
+        self.api_publish_timer.setInterval(API_PUBLISH_DELAY_MS)
+        self.api_publish_timer.timeout.connect(self._publish_api_state)
+
+        # Changed sections are diffed once per event-loop turn into an undo step, and into history after a pause
+        self.change_dirty_sections = set()
+        self.change_timer = QTimer(self)
+        self.change_timer.setSingleShot(True)
+        self.change_timer.setInterval(0)
+        self.change_timer.timeout.connect(self._collect_changes)
+        self.history_pending_ops = []
+        self.history_timer = QTimer(self)
+        self.history_timer.setSingleShot(True)
+        self.history_timer.setInterval(HISTORY_RECORD_DELAY_MS)
+        self.history_timer.timeout.connect(self._record_history)
+
+        self.rollover_timer = QTimer(self)
+        self.rollover_timer.setSingleShot(True)
+        self.rollover_timer.timeout.connect(self._check_rollover)
+
         self._create_ui()
         self._create_menu()
 
@@ -94,6 +2303,78 @@ class ProductivityApp(QMainWindow):
         self._set_theme(self.settings.get("theme", "dark"))
         self.tab_widget.setCurrentIndex(0)
         self._on_tab_change(0)
+        self._start_file_watcher()
+
+        for tab_names in STARTUP_PART_TABS.values():
+            self._set_tabs_loading(tab_names, True)
+        self.statusBar().showMessage("Loading your data...")
+        # Started from the event loop, so the window is painted before the workers compete for the GIL
+        QTimer.singleShot(0, self._start_loading)
+
+    # --- Startup Loading ---
+    def _start_loading(self):
+        self.profile_loader.request_parts(self.profile, self._get_default_data(), self.STATS)
+
+    def _set_tabs_loading(self, tab_names, loading):
+        for index in range(self.tab_widget.count()):
+            if self.tab_widget.tabText(index) in tab_names:
+                self.tab_widget.widget(index).setEnabled(not loading)
+
+    def _on_startup_part_loaded(self, part, future):
+        try:
+            result = future.result()
+        except concurrent.futures.CancelledError:
+            return
+        except Exception:
+            # Raising out of a slot would abort the app, so this part keeps the skeleton's defaults instead
+            file_path = {"data": self.data_file, "settings": self.settings_file, "rpg": self.rpg_data_file}[part].file_path
+            logging.exception(f"Could not load {file_path}; using defaults")
+            self.loading_parts.discard(part)
+            # The defaults will be saved over it, so keep a copy of what was there
+            if os.path.exists(file_path):
+                with contextlib.suppress(OSError):
+                    shutil.copy2(file_path, file_path + ".unreadable")
+            self.unreadable_files.append(file_path)
+            self._set_tabs_loading(STARTUP_PART_TABS[part], False)
+            if not self.loading_parts:
+                self._finish_loading()
+            return
+        self.loading_parts.discard(part)
+        if part == "data":
+            self.data, self.change_base, self.undo_log = result
+            changed_sections = list(self.data)
+        elif part == "settings":
+            previous_theme = self.settings.get("theme")
+            self.settings, changed_sections = result, []
+            self.keep_undo_action.setChecked(self.settings.get("keep_undo_history", False))
+            if self.settings.get("theme", "dark") != previous_theme:
+                self._set_theme(self.settings.get("theme", "dark"))
+        else:
+            (self.rpg_history, self.profile.trend_series, self.profile.xp), changed_sections = result, ["RPG Stats"]
+        for section in changed_sections:
+            self._mark_changed(section)
+        # Loaded data is not a change to undo or record
+        self.change_dirty_sections.clear()
+        self._update_undo_actions()
+        self._set_tabs_loading(STARTUP_PART_TABS[part], False)
+        self._load_tab_data(self.tab_widget.tabText(self.tab_widget.currentIndex()))
+        if not self.loading_parts:
+            self._finish_loading()
+
+    def _finish_loading(self):
+        """Runs what needs both the data and the settings, once everything has arrived."""
+        self.statusBar().clearMessage()
+        # The stats were read before the settings could say which level curve to use
+        if self.profile.xp.set_curve(level_curve(self.settings), self.rpg_history):
+            self._mark_changed("RPG Stats")
+            self._load_tab_data(self.tab_widget.tabText(self.tab_widget.currentIndex()))
+        self._check_rollover()
+        self.api_action.setChecked(self.settings.get("api_enabled", False))
+        # Catch anything written while the files were being read
+        self._sync_external_changes()
+        if self.unreadable_files:
+            files = "\n".join(f"{path} (copy kept as {os.path.basename(path)}.unreadable)" for path in self.unreadable_files)
+            QMessageBox.warning(self, "Loading Data", f"These files could not be read, so their defaults are shown instead:\n{files}")
 
     # --- Generic Data Handling ---
     def _get_default_data(self):
@@ -109,26 +2390,61 @@ class ProductivityApp(QMainWindow):
             "Ivy Lee Method": {"tasks": [{"title": "", "done": False} for _ in range(6)], "notes": ""}
         }
 
-    def _load_json(self, file_path, default_data):
-        if not os.path.exists(file_path):
-            return default_data
-        try:
-            with open(file_path, "r") as f:
-                data = json.load(f)
-                if default_data:
-                    for key, value in default_data.items():
-                        data.setdefault(key, value)
-                return data
-        except (json.JSONDecodeError, IOError) as e:
-            logging.error(f"Error loading {file_path}: {e}")
-            return default_data
+    # --- External Change Sync ---
+    def _start_file_watcher(self):
+        self.file_watcher = QFileSystemWatcher(self)
+        self.file_sync_timer = QTimer(self)
+        self.file_sync_timer.setSingleShot(True)
+        self.file_sync_timer.setInterval(FILE_SYNC_DEBOUNCE_MS)
+        self.file_sync_timer.timeout.connect(self._sync_external_changes)
+        self.file_watcher.fileChanged.connect(self._on_watched_path_changed)
+        self.file_watcher.directoryChanged.connect(self._on_watched_path_changed)
+        self._watch_data_files()
 
-    def _save_json(self, data, file_path):
-        try:
-            with open(file_path, "w") as f:
-                json.dump(data, f, indent=4)
-        except IOError as e:
-            logging.error(f"Error saving {file_path}: {e}")
+    def _watch_data_files(self):
+        # Atomic replaces drop a file from the watcher, and missing files can't be watched,
+        # so the parent directories are watched as well and the files re-added on each change.
+        synced_files = (self.data_file, self.settings_file, self.rpg_data_file)
+        paths = {f.file_path for f in synced_files if os.path.exists(f.file_path)}
+        paths |= {os.path.dirname(f.file_path) for f in synced_files}
+        missing = paths - set(self.file_watcher.files()) - set(self.file_watcher.directories())
+        if missing:
+            self.file_watcher.addPaths(sorted(missing))
+
+    def _on_watched_path_changed(self, _path):
+        self.file_sync_timer.start()
+
+    def _sync_external_changes(self):
+        if self.loading_parts:
+            return
+        self._watch_data_files()
+        self._collect_changes()
+        self.data, changed_sections = self.data_file.pull(self.data)
+        if changed_sections:
+            logging.info(f"Merged external changes to: {', '.join(sorted(changed_sections))}")
+            self.data = clean_task_data(self.data, self._get_default_data())
+        if self.rpg_data_file.has_external_change():
+            with self.rpg_data_file.locked():
+                rpg_history = self.rpg_data_file.read()
+            if rpg_history is not None:
+                rpg_history = clean_rpg_history(rpg_history)
+                previous, self.rpg_history, self.profile.trend_series = self.rpg_history, rpg_history, None
+                self.profile.xp.sync(previous, rpg_history)
+                changed_sections.add("RPG Stats")
+        for section in changed_sections:
+            self._mark_changed(section)
+        # Someone else's edits aren't ours to undo
+        self._collect_changes(undoable=False)
+        if changed_sections:
+            self._load_tab_data(self.tab_widget.tabText(self.tab_widget.currentIndex()))
+            self._update_dashboard()
+
+        self.settings, changed_settings = self.settings_file.pull(self.settings)
+        if "theme" in changed_settings:
+            self._set_theme(self.settings.get("theme", "dark"))
+        if "level_curve" in changed_settings and self.profile.xp.set_curve(level_curve(self.settings), self.rpg_history):
+            self._mark_changed("RPG Stats")
+            self._load_tab_data(self.tab_widget.tabText(self.tab_widget.currentIndex()))
 
     # --- UI Creation ---
     def _create_menu(self):
@@ -137,11 +2453,36 @@ class ProductivityApp(QMainWindow):
         clear_all_action = QAction("&Clear All Tasks", self)
         clear_all_action.triggered.connect(self._clear_all_tasks)
         file_menu.addAction(clear_all_action)
+        history_action = QAction("Task &History...", self)
+        history_action.triggered.connect(lambda: (self._record_history(), HistoryDialog(self.history, self).exec()))
+        file_menu.addAction(history_action)
+        archive_action = QAction("Browse &Archive...", self)
+        archive_action.triggered.connect(lambda: ArchiveDialog(self.archive, self).exec())
+        file_menu.addAction(archive_action)
         file_menu.addSeparator()
         exit_action = QAction("&Exit", self)
         exit_action.triggered.connect(self.close)
         file_menu.addAction(exit_action)
         
+        edit_menu = menu_bar.addMenu("&Edit")
+        self.undo_action = QAction("&Undo", self)
+        self.undo_action.setShortcut(QKeySequence.StandardKey.Undo)
+        self.undo_action.triggered.connect(self._undo)
+        edit_menu.addAction(self.undo_action)
+        self.redo_action = QAction("&Redo", self)
+        self.redo_action.setShortcut(QKeySequence.StandardKey.Redo)
+        self.redo_action.triggered.connect(self._redo)
+        edit_menu.addAction(self.redo_action)
+        edit_menu.addSeparator()
+        self.keep_undo_action = QAction("&Keep Undo History After Closing", self, checkable=True)
+        self.keep_undo_action.setChecked(self.settings.get("keep_undo_history", False))
+        self.keep_undo_action.toggled.connect(self._toggle_keep_undo_history)
+        edit_menu.addAction(self.keep_undo_action)
+        self._update_undo_actions()
+
+        self.profile_menu = menu_bar.addMenu("&Profile")
+        self.profile_menu.aboutToShow.connect(self._populate_profile_menu)
+
         navigate_menu = menu_bar.addMenu("&Navigate")
         tab_names = ["Dashboard", "RPG Stats", "Todo List", "Eat the Frog", "Eisenhower", "3/3/3", "Ivy Lee Method", "Pomodoro", "Help"]
         for i, name in enumerate(tab_names):
@@ -156,6 +2497,18 @@ class ProductivityApp(QMainWindow):
         dark_mode_action = QAction("Dark Mode", self)
         dark_mode_action.triggered.connect(lambda: self._set_theme("dark"))
         view_menu.addAction(dark_mode_action)
+
+        tools_menu = menu_bar.addMenu("&Tools")
+        self.api_action = QAction("Local &API Server", self, checkable=True)
+        self.api_action.setChecked(self.settings.get("api_enabled", False))
+        self.api_action.toggled.connect(self._toggle_api_server)
+        tools_menu.addAction(self.api_action)
+        copy_token_action = QAction("&Copy API Token", self)
+        copy_token_action.triggered.connect(self._copy_api_token)
+        tools_menu.addAction(copy_token_action)
+        recurring_action = QAction("&Recurring Tasks...", self)
+        recurring_action.triggered.connect(lambda: RecurringTasksDialog(self).exec())
+        tools_menu.addAction(recurring_action)
         
         help_menu = menu_bar.addMenu("&Help")
         about_action = QAction("&About", self)
@@ -203,20 +2556,40 @@ class ProductivityApp(QMainWindow):
         self.setStyleSheet(stylesheet)
         tooltip = "Switch to Dark Mode" if theme_name == "light" else "Switch to Light Mode"
         self.theme_toggle_button.setToolTip(tooltip)
-        # Regenerate graph on theme change if RPG tab is active
-        if self.tab_widget.tabText(self.tab_widget.currentIndex()) == "RPG Stats":
-            self._load_rpg_stats_data()
+        for chart in (self.rpg_chart, self.rpg_trend_chart, self.rpg_heatmap):
+            chart.set_theme(theme_name)
 
     def _toggle_theme(self):
         self._set_theme("light" if self.settings.get("theme") == "dark" else "dark")
 
-    def _on_tab_change(self, index):
-        tab_name = self.tab_widget.tabText(index).lower().replace(' ', '_').replace('-', '_')
+    def _mark_changed(self, section, rendered=False):
+        """Bumps a section's version. `rendered` means its widgets already show the change."""
+        self.data_versions[section] = self.data_versions.get(section, 0) + 1
+        if rendered:
+            self.rendered_versions[section] = self.data_versions[section]
+        if section in API_SLUGS_BY_SECTION:
+            self._mark_api_dirty(API_SLUGS_BY_SECTION[section])
+        if section in self.data:
+            self.change_dirty_sections.add(section)
+            if not self.change_timer.isActive():
+                self.change_timer.start()
+
+    def _load_tab_data(self, tab_text):
+        """Repopulates a tab's widgets, unless they already show the latest version of its data."""
+        version = self.data_versions.get(tab_text, 0)
+        if self.rendered_versions.get(tab_text) == version:
+            return
+        tab_name = tab_text.lower().replace(' ', '_').replace('-', '_').replace('/', '')
         loader_func = getattr(self, f"_load_{tab_name}_data", None)
         if loader_func:
             loader_func()
+            self.rendered_versions[tab_text] = version
         if tab_name == "dashboard":
             self._update_dashboard()
+            self._update_completion_history()
+
+    def _on_tab_change(self, index):
+        self._load_tab_data(self.tab_widget.tabText(index))
 
     # --- All Tab Creation Methods ---
     def _create_rpg_tab(self):
@@ -229,14 +2602,18 @@ class ProductivityApp(QMainWindow):
         
         stats_grid = QGridLayout()
         self.rpg_widgets = {}
+        self.rpg_xp_bars = {}
         row = 0
         for key, desc in self.STATS.items():
             label = QLabel(f"{desc} (+{key}):")
             spin_box = QSpinBox()
             spin_box.setRange(0, 10)
+            xp_bar = QProgressBar()
             stats_grid.addWidget(label, row, 0)
             stats_grid.addWidget(spin_box, row, 1)
+            stats_grid.addWidget(xp_bar, row, 2)
             self.rpg_widgets[key] = spin_box
+            self.rpg_xp_bars[key] = xp_bar
             row += 1
         
         input_layout.addLayout(stats_grid)
@@ -247,16 +2624,69 @@ class ProductivityApp(QMainWindow):
         input_layout.addStretch()
         input_container.setLayout(input_layout)
 
+        character_container = QGroupBox("Character")
+        character_layout = QVBoxLayout(character_container)
+        self.rpg_level_label = QLabel("")
+        self.rpg_level_label.setObjectName("headerLabel")
+        self.rpg_streak_label = QLabel("")
+        self.rpg_achievements_label = QLabel("")
+        self.rpg_achievements_label.setWordWrap(True)
+        character_layout.addWidget(self.rpg_level_label)
+        character_layout.addWidget(self.rpg_streak_label)
+        character_layout.addWidget(self.rpg_achievements_label)
+        left_layout = QVBoxLayout()
+        left_layout.addWidget(input_container)
+        left_layout.addWidget(character_container)
+
         # Right side for graph display
-        graph_container = QGroupBox("Latest Stats")
+        graph_container = QGroupBox("Your Stats")
         graph_layout = QVBoxLayout()
-        self.rpg_graph_label = QLabel("Log your first day of stats to see the graph!")
-        self.rpg_graph_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.rpg_graph_label.setMinimumSize(500, 500)
-        graph_layout.addWidget(self.rpg_graph_label)
+        view_combo = QComboBox()
+        view_combo.addItems(["Latest Day", "Trends", "Calendar"])
+        graph_layout.addWidget(view_combo, 0, Qt.AlignmentFlag.AlignRight)
+        self.rpg_views = QStackedWidget()
+        view_combo.currentIndexChanged.connect(self.rpg_views.setCurrentIndex)
+        graph_layout.addWidget(self.rpg_views)
+
+        radar_page = QWidget()
+        radar_layout = QVBoxLayout(radar_page)
+        radar_layout.setContentsMargins(0, 0, 0, 0)
+        self.rpg_chart = RadarChartWidget(self.STATS.values())
+        self.rpg_chart.setMinimumSize(500, 500)
+        self.rpg_chart.set_message("Log your first day of stats to see the graph!")
+        radar_layout.addWidget(self.rpg_chart)
+
+        day_nav_layout = QHBoxLayout()
+        self.rpg_prev_day_button = QPushButton("◀")
+        self.rpg_prev_day_button.clicked.connect(lambda: self._show_rpg_day(self.rpg_day_index - 1))
+        self.rpg_day_label = QLabel("")
+        self.rpg_day_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.rpg_next_day_button = QPushButton("▶")
+        self.rpg_next_day_button.clicked.connect(lambda: self._show_rpg_day(self.rpg_day_index + 1))
+        day_nav_layout.addWidget(self.rpg_prev_day_button)
+        day_nav_layout.addWidget(self.rpg_day_label, 1)
+        day_nav_layout.addWidget(self.rpg_next_day_button)
+        radar_layout.addLayout(day_nav_layout)
+        self.rpg_views.addWidget(radar_page)
+
+        self.rpg_trend_chart = TrendChartWidget(self.STATS.keys())
+        self.rpg_views.addWidget(self.rpg_trend_chart)
+
+        calendar_page = QWidget()
+        calendar_layout = QVBoxLayout(calendar_page)
+        calendar_layout.setContentsMargins(0, 0, 0, 0)
+        metric_combo = QComboBox()
+        metric_combo.addItem("All Stats (Total)", None)
+        for key, desc in self.STATS.items():
+            metric_combo.addItem(f"{desc} ({key})", key)
+        metric_combo.currentIndexChanged.connect(lambda _: self.rpg_heatmap.set_metric(metric_combo.currentData()))
+        calendar_layout.addWidget(metric_combo, 0, Qt.AlignmentFlag.AlignLeft)
+        self.rpg_heatmap = CalendarHeatmapWidget(self.STATS.keys())
+        calendar_layout.addWidget(self.rpg_heatmap, 1)
+        self.rpg_views.addWidget(calendar_page)
         graph_container.setLayout(graph_layout)
 
-        main_layout.addWidget(input_container, 1)
+        main_layout.addLayout(left_layout, 1)
         main_layout.addWidget(graph_container, 2)
         return tab
         
@@ -269,8 +2699,11 @@ class ProductivityApp(QMainWindow):
         self.dash_stats_label = QLabel("Task statistics will appear here.")
         self.dash_stats_label.setAlignment(Qt.AlignmentFlag.AlignTop)
         self.dash_stats_label.setWordWrap(True)
+        self.dash_history_label = QLabel("")
+        self.dash_history_label.setAlignment(Qt.AlignmentFlag.AlignTop)
         layout.addWidget(self.dash_status_label)
         layout.addWidget(self.dash_stats_label)
+        layout.addWidget(self.dash_history_label)
         return tab
 
     def _create_task_list_ui(self, placeholder_text, add_callback):
@@ -286,16 +2719,11 @@ class ProductivityApp(QMainWindow):
         input_layout.addWidget(add_btn)
         main_layout.addLayout(input_layout)
         
-        scroll_area = QScrollArea()
-        scroll_area.setWidgetResizable(True)
-        scroll_content = QWidget()
-        scroll_content.setObjectName("scrollListContent")
-        task_list_layout = QVBoxLayout(scroll_content)
-        task_list_layout.setAlignment(Qt.AlignmentFlag.AlignTop)
-        scroll_area.setWidget(scroll_content)
-        main_layout.addWidget(scroll_area)
+        task_list = QListWidget()
+        task_list.setSelectionMode(QAbstractItemView.SelectionMode.ExtendedSelection)
+        main_layout.addWidget(task_list)
         
-        return container, task_list_layout
+        return container, task_list
 
     def _create_eat_the_frog_tab(self):
         tab = QWidget()
@@ -312,26 +2740,25 @@ class ProductivityApp(QMainWindow):
         frog_checkbox.stateChanged.connect(self._save_eat_the_frog_data)
         frog_entry.textChanged.connect(self._save_eat_the_frog_data)
         
-        other_tasks_container, task_list_layout = self._create_task_list_ui("Add a secondary task...", self._add_other_frog_task)
+        other_tasks_container, task_list = self._create_task_list_ui("Add a secondary task...", self._add_other_frog_task)
+        other_tasks_container.layout().addLayout(self._create_bulk_bar(lambda: {"frog": self._selected_rows(task_list)}))
         other_tasks_box = QGroupBox("Other Tasks")
         other_tasks_box.setLayout(other_tasks_container.layout())
         layout.addWidget(other_tasks_box)
         
-        self.task_widgets["Eat the Frog"].update({"frog_checkbox": frog_checkbox, "frog_entry": frog_entry, "other_tasks_layout": task_list_layout})
+        self.task_widgets["Eat the Frog"].update({"frog_checkbox": frog_checkbox, "frog_entry": frog_entry, "other_tasks_list": task_list})
         return tab
 
     def _create_eisenhower_tab(self):
         tab = QWidget()
         layout = QGridLayout(tab)
         self.task_widgets["Eisenhower"] = {}
-        quadrants = {"do": ("Urgent & Important (Do)", 0, 0), "schedule": ("Important, Not Urgent (Schedule)", 0, 1), "delegate": ("Urgent, Not Important (Delegate)", 1, 0), "delete": ("Not Urgent, Not Important (Delete)", 1, 1)}
-        
-        for key, (title, row, col) in quadrants.items():
+        for key, (title, row, col) in EISENHOWER_QUADRANTS.items():
             box = QGroupBox(title)
             box_layout = QVBoxLayout()
             list_widget = QListWidget()
 
-            list_widget.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
+            list_widget.setSelectionMode(QAbstractItemView.SelectionMode.ExtendedSelection)
             list_widget.setDragEnabled(True)
             list_widget.setAcceptDrops(True)
             list_widget.setDropIndicatorShown(True)
@@ -353,6 +2780,8 @@ class ProductivityApp(QMainWindow):
         input_layout.addWidget(task_entry)
         input_layout.addWidget(add_button)
         layout.addLayout(input_layout, 2, 0, 1, 2)
+        quadrant_lists = self.task_widgets["Eisenhower"]
+        layout.addLayout(self._create_bulk_bar(lambda: {f"eisenhower/{key}": self._selected_rows(list_widget) for key, list_widget in quadrant_lists.items()}), 3, 0, 1, 2)
         return tab
 
     def _create_todo_list_tab(self):
@@ -370,12 +2799,16 @@ class ProductivityApp(QMainWindow):
             self.task_widgets["Todo List"][f"filter_{key}"] = btn
         main_layout.addLayout(filter_layout)
         task_list = QListWidget()
+        task_list.setSelectionMode(QAbstractItemView.SelectionMode.ExtendedSelection)
         self.task_widgets["Todo List"]["list"] = task_list
         main_layout.addWidget(task_list)
+        # Rows carry their task's index, since the filter can hide some tasks
+        selected_tasks = lambda: {"todo": {item.data(Qt.ItemDataRole.UserRole) for item in task_list.selectedItems()}}
+        main_layout.addLayout(self._create_bulk_bar(selected_tasks, priorities=True))
         input_layout = QHBoxLayout()
         task_entry = QLineEdit(placeholderText="Add a new todo task...")
         priority_combo = QComboBox()
-        priority_combo.addItems(["High", "Medium", "Low"])
+        priority_combo.addItems(TODO_PRIORITIES)
         add_btn = QPushButton("Add Task")
         add_btn.clicked.connect(lambda: self._add_todo_task(task_entry, priority_combo))
         input_layout.addWidget(task_entry)
@@ -387,6 +2820,34 @@ class ProductivityApp(QMainWindow):
         main_layout.addWidget(clear_btn, 0, Qt.AlignmentFlag.AlignRight)
         return tab
 
+    def _create_bulk_bar(self, selection_getter, priorities=False):
+        """A row of actions applied to every selected task at once (Ctrl/Shift-click to select several)."""
+        bar = QHBoxLayout()
+        bar.addWidget(QLabel("Selected:"))
+        for text, action in (("Complete", "complete"), ("Delete", "delete")):
+            btn = QPushButton(text)
+            btn.clicked.connect(lambda _, a=action: self._apply_bulk_action(selection_getter(), a))
+            bar.addWidget(btn)
+        if priorities:
+            priority_combo = QComboBox()
+            priority_combo.addItems(TODO_PRIORITIES)
+            priority_btn = QPushButton("Set Priority")
+            priority_btn.clicked.connect(lambda: self._apply_bulk_action(selection_getter(), "priority", priority_combo.currentText()))
+            bar.addWidget(priority_combo)
+            bar.addWidget(priority_btn)
+        quadrant_combo = QComboBox()
+        for key in EISENHOWER_QUADRANTS:
+            quadrant_combo.addItem(key.title(), f"eisenhower/{key}")
+        move_btn = QPushButton("Move to Quadrant")
+        move_btn.clicked.connect(lambda: self._apply_bulk_action(selection_getter(), "move", quadrant_combo.currentData()))
+        bar.addWidget(quadrant_combo)
+        bar.addWidget(move_btn)
+        bar.addStretch()
+        return bar
+
+    def _selected_rows(self, list_widget):
+        return {list_widget.row(item) for item in list_widget.selectedItems()}
+
     def _create_category_box(self, title, key_name):
         box = QGroupBox(title)
         box_layout = QVBoxLayout()
@@ -465,7 +2926,8 @@ class ProductivityApp(QMainWindow):
             <h1>Productivity Methods Explained</h1>
             
             <h2>&bull; RPG Stats</h2>
-            <p>This tab gamifies your personal development. By assigning points (0-10) to different areas of your life each day, you can visually track your growth over time. The goal is to maintain a balanced development, much like leveling up a character in a role-playing game. The generated radar chart provides an instant overview of your focus areas.</p>
+            <p>This tab gamifies your personal development. By assigning points (0-10) to different areas of your life each day, you can visually track your growth over time. The goal is to maintain a balanced development, much like leveling up a character in a role-playing game. The generated radar chart provides an instant overview of your focus areas. Switch to <b>Trends</b> to follow every stat across your whole history (scroll to zoom, drag to pan, double-click to reset), or to <b>Calendar</b> for a day-by-day heatmap.</p>
+            <p>Every point you log earns 10 XP in that stat, and each stat levels up on its own bar. Logging on consecutive days builds a streak that adds 5% XP per day (up to +50%), and milestones such as a week-long streak or a perfect day unlock achievements. Correcting a past day recalculates everything after it. The XP needed per level follows <code>base &times; (level - 1)<sup>exponent</sup></code>; set <code>"level_curve": {"base": 100, "exponent": 1.5}</code> in <code>settings.json</code> to change it.</p>
             
             <h2>&bull; Todo List</h2>
             <p>A classic but powerful tool for organizing your day. This implementation includes:</p>
@@ -487,6 +2949,7 @@ class ProductivityApp(QMainWindow):
                 <li><b>Not Urgent, Not Important (Delete):</b> Tasks you should eliminate.</li>
             </ul>
             <p>You can drag and drop tasks between quadrants as their priority changes.</p>
+            <p>In the Todo List, Eisenhower and Eat the Frog tabs, Ctrl- or Shift-click to select several tasks, then use the <b>Selected:</b> row to complete, delete, reprioritize or move them to a quadrant all at once.</p>
             
             <h2>&bull; 3/3/3 Rule</h2>
             <p>A method for structuring your day with intentionality. You define:</p>
@@ -507,52 +2970,97 @@ class ProductivityApp(QMainWindow):
             <h2>&bull; Pomodoro Timer</h2>
             <p>A built-in timer based on the Pomodoro Technique. Work in focused 25-minute intervals, followed by short breaks. This method is scientifically proven to enhance focus and prevent burnout by breaking down large tasks into manageable chunks.</p>
             
+            <h2>&bull; Local API</h2>
+            <p>Turn on <b>Tools &rarr; Local API Server</b> to let scripts and editor plugins on this computer read and update your data over HTTP (port 8765, localhost only). <code>GET /api/state</code> and <code>GET /api/sections/&lt;name&gt;</code> return JSON with an ETag, <code>GET /api/changes?since=&lt;version&gt;</code> waits for the next change, and <code>POST /api/batch</code> applies a list of operations all at once (sent as <code>application/json</code>). Every request needs the header <code>Authorization: Bearer &lt;token&gt;</code>, using the token from <b>Tools &rarr; Copy API Token</b> (stored as <code>api_token</code> in <code>settings.json</code>), so web pages open in your browser can't reach your data.</p>
+
             <h2>&bull; Auto-Save</h2>
             <p>Your progress is valuable. The application automatically saves all your task and stat data to local JSON files (`productivity_data.json` and `stats/progress_data.json`) every time you close the window, ensuring your work is never lost.</p>
+            <p>At midnight, everything you finished that day moves into a compressed archive (the <code>archive</code> folder, one file per month) and unfinished tasks carry over, so the working list stays short. Past days can be viewed with <b>File &rarr; Browse Archive</b>.</p>
+            <p>Every change is also recorded in the <code>history</code> folder, so <b>File &rarr; Task History</b> can show your lists exactly as they were at any moment, and the Dashboard charts your completion rate over the last two weeks.</p>
+            <p>Use the <b>Profile</b> menu to keep separate datasets, e.g. for several people on one computer. Each profile has its own tasks, stats, settings, archive and history in <code>profiles/&lt;name&gt;</code>; the <b>Default</b> profile keeps using the files next to the app. Recently used profiles stay loaded, so switching back to them is instant.</p>
+            <p><b>Edit &rarr; Undo</b> (Ctrl+Z) and <b>Redo</b> step back and forth through your changes, including deletes, bulk actions and <b>Clear All Tasks</b>. Typing into one field undoes as a single step. Changes merged in from another instance or the daily rollover can't be undone. Turn on <b>Keep Undo History After Closing</b> to be able to undo across restarts.</p>
+            <p><b>Tools &rarr; Recurring Tasks</b> sets up tasks that repeat every day, weekday, week or month, and day templates: save today's lists as a template, apply it to today, or let a rule add it on schedule. Each day's recurring tasks are added when that day starts, and a task you delete stays deleted for the day. Pick a date in the calendar to preview what it will get.</p>
+            <p>If the same files are changed by another running copy of the app or by a sync tool, the changes are merged in task by task instead of being overwritten.</p>
         """)
         layout.addWidget(help_text)
         return tab
         
     # --- Data Loaders ---
     def _load_rpg_stats_data(self):
-        data = self._load_json(RPG_DATA_FILE, {})
+        data = self.rpg_history
         today = datetime.date.today().isoformat()
         
-        if data and today in data:
-            for key, spin_box in self.rpg_widgets.items():
-                spin_box.setValue(data[today].get(key, 0))
+        for key, spin_box in self.rpg_widgets.items():
+            spin_box.setValue(data.get(today, {}).get(key, 0))
 
-        if data:
-            self._generate_rpg_graph(update_display=True)
-        else:
-            self.rpg_graph_label.setText("Log your first day of stats to see the graph!")
+        self.rpg_dates = sorted(data)
+        if self.profile.trend_series is None:
+            self.profile.trend_series = build_trend_series(data, self.STATS)
+        self.rpg_trend_chart.set_series(self.profile.trend_series)
+        self.rpg_heatmap.set_history(data)
+        self._show_rpg_day(len(self.rpg_dates) - 1)
+        self._update_rpg_character()
+
+    def _update_rpg_character(self):
+        engine = self.profile.xp
+        totals = engine.totals()
+        for key, xp_bar in self.rpg_xp_bars.items():
+            level, earned, needed = level_for_xp(totals[key], engine.curve)
+            xp_bar.setRange(0, max(round(needed), 1))
+            xp_bar.setValue(round(earned))
+            xp_bar.setFormat(f"Lv {level}")
+            xp_bar.setToolTip(f"{totals[key]} XP in total, {round(needed - earned)} to level {level + 1}")
+        total_xp = sum(totals.values())
+        level = level_for_xp(total_xp / max(len(totals), 1), engine.curve)[0]
+        self.rpg_level_label.setText(f"Character Level {level}  ·  {total_xp} XP")
+        streak = engine.current_streak(datetime.date.today().isoformat())
+        bonus = round(min(streak * STREAK_BONUS_STEP, STREAK_BONUS_CAP) * 100)
+        self.rpg_streak_label.setText(f"Streak: {streak} day{'s' if streak != 1 else ''}" + (f" (next day's XP +{bonus}%)" if streak else ""))
+        achievements = []
+        for key, (name, description) in RPG_ACHIEVEMENTS.items():
+            if key in engine.achievements:
+                achievements.append(f"<b>&#9733; {name}</b> &mdash; {description} ({engine.achievements[key]})")
+            else:
+                achievements.append(f"<span style='color: gray;'>{name} &mdash; {description}</span>")
+        self.rpg_achievements_label.setText("<br>".join(achievements))
 
-    def _clear_layout(self, layout):
-        if layout is None: return
-        while layout.count():
-            item = layout.takeAt(0)
-            if item.widget(): item.widget().deleteLater()
+    def _show_rpg_day(self, index):
+        if not self.rpg_dates:
+            self.rpg_day_index = -1
+            self.rpg_chart.set_message("Log your first day of stats to see the graph!")
+            self.rpg_day_label.setText("")
+        else:
+            self.rpg_day_index = min(max(index, 0), len(self.rpg_dates) - 1)
+            date = self.rpg_dates[self.rpg_day_index]
+            values = [self.rpg_history[date].get(key, 0) for key in self.STATS]
+            self.rpg_chart.set_values(values, f"RPG Stats for {date}")
+            self.rpg_day_label.setText(f"Day {self.rpg_day_index + 1} of {len(self.rpg_dates)}")
+        self.rpg_prev_day_button.setEnabled(self.rpg_day_index > 0)
+        self.rpg_next_day_button.setEnabled(0 <= self.rpg_day_index < len(self.rpg_dates) - 1)
 
+    @populates_widgets
     def _load_eat_the_frog_data(self):
         data = self.data["Eat the Frog"]
         widgets = self.task_widgets["Eat the Frog"]
         widgets["frog_entry"].setText(data["frog"]["title"])
         widgets["frog_checkbox"].setChecked(data["frog"]["done"])
-        self._clear_layout(widgets["other_tasks_layout"])
-        for idx, task in enumerate(data.get("other_tasks", [])):
-            task_widget = QWidget()
-            task_layout = QHBoxLayout(task_widget)
-            checkbox = QCheckBox(task["title"])
-            checkbox.setChecked(task["done"])
-            checkbox.stateChanged.connect(lambda state, i=idx: self._toggle_other_frog_task(i, state))
-            delete_btn = QPushButton("Delete")
-            delete_btn.setObjectName("deleteButton")
-            delete_btn.clicked.connect(lambda _, i=idx: self._delete_other_frog_task(i))
-            task_layout.addWidget(checkbox)
-            task_layout.addStretch()
-            task_layout.addWidget(delete_btn)
-            widgets["other_tasks_layout"].addWidget(task_widget)
+        self._fill_task_list(widgets["other_tasks_list"], list(enumerate(data.get("other_tasks", []))), self._create_frog_task_widget)
 
+    def _create_frog_task_widget(self, task, index):
+        task_widget = QWidget()
+        task_layout = QHBoxLayout(task_widget)
+        checkbox = QCheckBox(task["title"])
+        checkbox.setChecked(task["done"])
+        checkbox.stateChanged.connect(lambda state, i=index: self._toggle_other_frog_task(i, state))
+        delete_btn = QPushButton("Delete")
+        delete_btn.setObjectName("deleteButton")
+        delete_btn.clicked.connect(lambda _, i=index: self._delete_other_frog_task(i))
+        task_layout.addWidget(checkbox)
+        task_layout.addStretch()
+        task_layout.addWidget(delete_btn)
+        return task_widget
+
+    @populates_widgets
     def _load_eisenhower_data(self):
         for key, list_widget in self.task_widgets["Eisenhower"].items():
             list_widget.clear()
@@ -587,16 +3095,43 @@ class ProductivityApp(QMainWindow):
 
     def _load_todo_list_data(self):
         list_widget = self.task_widgets["Todo List"]["list"]
-        list_widget.clear()
         current_filter = self.data["Todo List"]["filter"]
-        for i, task in enumerate(self.data["Todo List"]["tasks"]):
-            if (current_filter == "all" or (current_filter == "active" and not task["done"]) or (current_filter == "completed" and task["done"])):
-                item_widget = self._create_todo_item_widget(task, i)
-                list_item = QListWidgetItem(list_widget)
-                list_item.setSizeHint(item_widget.sizeHint())
-                list_widget.addItem(list_item)
-                list_widget.setItemWidget(list_item, item_widget)
+        for key, btn in self.task_widgets["Todo List"].items():
+            if key.startswith("filter_"):
+                btn.setChecked(key == f"filter_{current_filter}")
+        rows = [(i, task) for i, task in enumerate(self.data["Todo List"]["tasks"])
+                if (current_filter == "all" or (current_filter == "active" and not task["done"]) or (current_filter == "completed" and task["done"]))]
+        self._fill_task_list(list_widget, rows, self._create_todo_item_widget)
+
+    def _fill_task_list(self, list_widget, rows, create_widget):
+        """Refills a list with one row per (index, task), each row's item carrying its task index.
+
+        All rows are added before any row widget, since every insertion re-lays out the widgets
+        already placed. The widgets are then created LIST_RENDER_BATCH at a time, one batch per
+        event-loop turn, so a long list shows its first screenful at once instead of freezing the window.
+        """
+        list_widget.clear()
+        items = []
+        for index, _ in rows:
+            item = QListWidgetItem(list_widget)
+            item.setData(Qt.ItemDataRole.UserRole, index)
+            items.append(item)
+        generation = self.list_fill_generations.get(list_widget, 0) + 1
+        self.list_fill_generations[list_widget] = generation
+
+        def fill_batch(start):
+            # A newer fill has cleared the list, and these items with it
+            if self.list_fill_generations[list_widget] != generation:
+                return
+            for item, (index, task) in zip(items[start:start + LIST_RENDER_BATCH], rows[start:start + LIST_RENDER_BATCH]):
+                widget = create_widget(task, index)
+                item.setSizeHint(widget.sizeHint())
+                list_widget.setItemWidget(item, widget)
+            if start + LIST_RENDER_BATCH < len(rows):
+                QTimer.singleShot(0, lambda: fill_batch(start + LIST_RENDER_BATCH))
+        fill_batch(0)
     
+    @populates_widgets
     def _load_333_data(self):
         data = self.data["3/3/3"]
         widgets = self.task_widgets["3/3/3"]
@@ -605,6 +3140,7 @@ class ProductivityApp(QMainWindow):
                 widgets[key][i]["entry"].setText(data.get(key, [])[i].get("title", ""))
                 widgets[key][i]["checkbox"].setChecked(data.get(key, [])[i].get("done", False))
 
+    @populates_widgets
     def _load_ivy_lee_method_data(self):
         data, widgets = self.data["Ivy Lee Method"], self.task_widgets["Ivy Lee Method"]
         tasks = data.get("tasks", [])
@@ -615,37 +3151,72 @@ class ProductivityApp(QMainWindow):
         widgets["notes_editor"].setPlainText(data.get("notes", ""))
 
     # --- RPG Logic Methods ---
+    def _write_rpg_stats(self, entries):
+        """Saves the stats in `entries` ({date: stats}) in one write. Returns the ids of the achievements this unlocked.
+
+        Raises OSError, leaving everything as it was, if the file can't be written.
+        """
+        with self.rpg_data_file.locked():
+            external_change = self.rpg_data_file.has_external_change()
+            data = self.rpg_data_file.read()
+            if not isinstance(data, dict):
+                data = {}
+            for date, stats in entries.items():
+                if not isinstance(data.get(date), dict):
+                    data[date] = {}
+                data[date].update(stats)
+            # Anything else in the file is written back untouched, but kept out of the stats
+            if not self.rpg_data_file.write(data):
+                raise OSError(f"Could not write {self.rpg_data_file.file_path}")
+        data = clean_rpg_history(data)
+        previous, self.rpg_history, self.profile.trend_series = self.rpg_history, data, None
+        # Only the logged days changed, unless someone else wrote to the file since we last read it
+        if external_change or len(entries) > 1:
+            unlocked = self.profile.xp.sync(previous, data)
+        else:
+            unlocked = self.profile.xp.update(data, next(iter(entries)))
+        self._mark_changed("RPG Stats")
+        return unlocked
+
+    def _rpg_levels(self):
+        return {key: level_for_xp(xp, self.profile.xp.curve)[0] for key, xp in self.profile.xp.totals().items()}
+
     def _log_rpg_progress(self):
         today = datetime.date.today().isoformat()
-        data = self._load_json(RPG_DATA_FILE, {})
-        if today not in data:
-            data[today] = {}
-        
-        for key, spin_box in self.rpg_widgets.items():
-            data[today][key] = spin_box.value()
-            
-        self._save_json(data, RPG_DATA_FILE)
-        self._generate_rpg_graph(update_display=True)
+        levels_before = self._rpg_levels()
+        try:
+            unlocked = self._write_rpg_stats({today: {key: spin_box.value() for key, spin_box in self.rpg_widgets.items()}})
+        except OSError as e:
+            QMessageBox.warning(self, "Error", f"Could not save today's progress:\n{e}")
+            return
+        self._load_tab_data("RPG Stats")
+        self._export_rpg_wallpaper()
         self._set_rpg_wallpaper()
         self._send_rpg_notification()
 
-        QMessageBox.information(self, "Success", "Progress logged and wallpaper updated!")
+        lines = ["Progress logged and wallpaper updated!"]
+        lines += [f"{key} reached level {level}!" for key, level in self._rpg_levels().items() if level > levels_before[key]]
+        lines += [f"Achievement unlocked: {RPG_ACHIEVEMENTS[key][0]}" for key in unlocked]
+        QMessageBox.information(self, "Success", "\n".join(lines))
+
+    def _export_rpg_wallpaper(self):
+        """Renders the latest day's radar chart to the wallpaper PNG.
+
+        This is the only place matplotlib is used, so it is imported here rather than at startup.
+        """
+        import numpy as np
+        from matplotlib.figure import Figure
 
-    # --- MODIFIED: This function is now theme-aware ---
-    def _generate_rpg_graph(self, update_display=False):
-        data = self._load_json(RPG_DATA_FILE, {})
+        data = self.rpg_history
         if not data:
             return
 
-        # Define colors based on the current theme
-        is_dark_theme = self.settings.get("theme", "dark") == "dark"
-        bg_color = '#212121' if is_dark_theme else '#f0f0f0'
-        text_color = '#eee' if is_dark_theme else '#111'
-        grid_color = '#555' if is_dark_theme else '#bbb'
-        line_color = '#3f51b5'
-        fill_color = '#3f51b5'
+        # Match the in-app chart's theme colors
+        colors = RADAR_THEMES.get(self.settings.get("theme", "dark"), RADAR_THEMES["dark"])
+        bg_color, text_color, grid_color = colors["background"], colors["text"], colors["grid"]
+        line_color = fill_color = colors["line"]
 
-        latest = list(data.keys())[-1]
+        latest = max(data)
         values = data[latest]
         labels = list(self.STATS.values())
         stats_keys = list(self.STATS.keys())
@@ -656,8 +3227,10 @@ class ProductivityApp(QMainWindow):
         stats_values += stats_values[:1]
         angles += angles[:1]
 
-        fig, ax = plt.subplots(figsize=(8, 8), subplot_kw=dict(polar=True))
-        
+        # A bare Figure (no pyplot) isn't registered globally, so nothing needs closing afterwards
+        fig = Figure(figsize=(8, 8))
+        ax = fig.add_subplot(polar=True)
+
         # Apply theme colors
         fig.patch.set_facecolor(bg_color)
         ax.set_facecolor(bg_color)
@@ -665,36 +3238,26 @@ class ProductivityApp(QMainWindow):
 
         ax.fill(angles, stats_values, color=fill_color, alpha=0.25)
         ax.plot(angles, stats_values, color=line_color, linewidth=2)
-        
-        ax.set_yticks(range(0, 11, 2))
-        ax.set_ylim(0, 10)
+
+        ax.set_yticks(range(0, RADAR_MAX_VALUE + 1, RADAR_RING_STEP))
+        ax.set_ylim(0, RADAR_MAX_VALUE)
         ax.tick_params(axis='y', colors=text_color)
-        
+
         ax.set_xticks(angles[:-1])
         ax.set_xticklabels(labels, fontsize=10, color=text_color)
-        
-        title = plt.title(f"RPG Stats for {latest}", size=15, y=1.1)
+
+        title = ax.set_title(f"RPG Stats for {latest}", size=15, y=1.1)
         title.set_color(text_color)
-        
+
         ax.grid(color=grid_color)
-        
-        plt.tight_layout()
+
+        fig.tight_layout()
 
         # Save with the correct background color
-        plt.savefig(RPG_WALLPAPER_FILE, facecolor=fig.get_facecolor())
-        plt.close()
-
-        if update_display:
-            pixmap = QPixmap(RPG_WALLPAPER_FILE)
-            self.rpg_graph_label.setPixmap(pixmap.scaled(
-                self.rpg_graph_label.width(), 
-                self.rpg_graph_label.height(), 
-                Qt.AspectRatioMode.KeepAspectRatio,
-                Qt.TransformationMode.SmoothTransformation
-            ))
+        fig.savefig(self.profile.wallpaper_file, facecolor=fig.get_facecolor())
 
     def _set_rpg_wallpaper(self):
-        path = os.path.abspath(RPG_WALLPAPER_FILE)
+        path = os.path.abspath(self.profile.wallpaper_file)
         if platform.system() == "Windows":
             ctypes.windll.user32.SystemParametersInfoW(20, 0, path, 3)
         elif platform.system() == "Darwin":
@@ -715,85 +3278,120 @@ class ProductivityApp(QMainWindow):
             logging.error(f"Failed to send notification: {e}")
 
     # --- Data Savers & Actions ---
-    def _save_and_update(self):
+    def _save_and_update(self, section, rendered=False):
+        self._mark_changed(section, rendered)
+        if section == self.tab_widget.tabText(self.tab_widget.currentIndex()):
+            self._load_tab_data(section)
         self._update_dashboard()
 
     def _save_eat_the_frog_data(self):
+        if self._populating_widgets: return
         widgets = self.task_widgets["Eat the Frog"]
         self.data["Eat the Frog"]["frog"]["title"] = widgets["frog_entry"].text()
         self.data["Eat the Frog"]["frog"]["done"] = widgets["frog_checkbox"].isChecked()
-        self._save_and_update()
+        self._save_and_update("Eat the Frog", rendered=True)
 
     def _add_other_frog_task(self, entry_widget):
         if title := entry_widget.text().strip():
             self.data["Eat the Frog"]["other_tasks"].append({"title": title, "done": False})
             entry_widget.clear()
-            self._load_eat_the_frog_data()
-            self._save_and_update()
+            self._save_and_update("Eat the Frog")
 
     def _toggle_other_frog_task(self, index, state):
         self.data["Eat the Frog"]["other_tasks"][index]["done"] = (state == Qt.CheckState.Checked.value)
-        self._save_and_update()
+        self._save_and_update("Eat the Frog", rendered=True)
         
     def _delete_other_frog_task(self, index):
         self.data["Eat the Frog"]["other_tasks"].pop(index)
-        self._load_eat_the_frog_data()
-        self._save_and_update()
+        self._save_and_update("Eat the Frog")
 
     def _add_eisenhower_task(self, entry_widget):
         if title := entry_widget.text().strip():
             self.data["Eisenhower"]["do"].append({"title": title, "done": False})
             entry_widget.clear()
-            self._load_eisenhower_data()
-            self._save_and_update()
+            self._save_and_update("Eisenhower")
 
     def _save_eisenhower_data(self):
+        if self._populating_widgets: return
         for key, list_widget in self.task_widgets["Eisenhower"].items():
             self.data["Eisenhower"][key] = [{"title": list_widget.item(i).text(), "done": list_widget.item(i).checkState() == Qt.CheckState.Checked} for i in range(list_widget.count())]
-        self._save_and_update()
+        self._save_and_update("Eisenhower", rendered=True)
 
     def _set_todo_filter(self, new_filter):
         self.data["Todo List"]["filter"] = new_filter
         for key, btn in self.task_widgets["Todo List"].items():
             if key.startswith("filter_") and isinstance(btn, QPushButton):
                 btn.setChecked(key == f"filter_{new_filter}")
-        self._load_todo_list_data()
+        self._save_and_update("Todo List")
 
     def _add_todo_task(self, entry, combo):
         if title := entry.text().strip():
             self.data["Todo List"]["tasks"].append({"title": title, "done": False, "priority": combo.currentText()})
             entry.clear()
-            self._load_todo_list_data()
-            self._save_and_update()
+            self._save_and_update("Todo List")
 
     def _toggle_todo_task_status(self, index, state):
         self.data["Todo List"]["tasks"][index]["done"] = (state == Qt.CheckState.Checked.value)
-        self._load_todo_list_data()
-        self._save_and_update()
+        self._save_and_update("Todo List")
 
     def _delete_todo_task(self, index):
         self.data["Todo List"]["tasks"].pop(index)
-        self._load_todo_list_data()
-        self._save_and_update()
+        self._save_and_update("Todo List")
 
     def _clear_completed_todos(self):
         self.data["Todo List"]["tasks"] = [t for t in self.data["Todo List"]["tasks"] if not t["done"]]
-        self._load_todo_list_data()
-        self._save_and_update()
+        self._save_and_update("Todo List")
+
+    def _apply_bulk_action(self, selection, action, value=None):
+        """Applies one action to every selected task in a single pass over each list, then re-renders and saves once.
+
+        `selection` maps list names as used by the API ("todo", "frog", "eisenhower/do", ...) to sets of indices.
+        """
+        if not any(selection.values()):
+            return
+        moved, touched = [], set()
+        for target, indices in selection.items():
+            if not indices or (action == "move" and target == value):
+                continue
+            tasks, _ = self._api_task_list(self.data, target)
+            kept = []
+            for index, task in enumerate(tasks):
+                if index not in indices:
+                    kept.append(task)
+                elif action == "complete":
+                    task["done"] = True
+                    kept.append(task)
+                elif action == "priority":
+                    task["priority"] = value
+                    kept.append(task)
+                elif action == "move":
+                    moved.append({"title": task["title"], "done": task["done"]})
+            tasks[:] = kept
+            touched.add(API_DATA_SECTIONS[target.partition("/")[0]])
+        if moved:
+            self._api_task_list(self.data, value)[0].extend(moved)
+            touched.add("Eisenhower")
+        for section in touched:
+            self._mark_changed(section)
+        self.data = self.data_file.save(self.data)
+        self._load_tab_data(self.tab_widget.tabText(self.tab_widget.currentIndex()))
+        self._update_dashboard()
     
     def _save_333_data(self):
+        if self._populating_widgets: return
         widgets = self.task_widgets["3/3/3"]
         for key in widgets:
             for i in range(3):
                 self.data["3/3/3"][key][i]["title"] = widgets[key][i]["entry"].text()
                 self.data["3/3/3"][key][i]["done"] = widgets[key][i]["checkbox"].isChecked()
-        self._save_and_update()
+        self._save_and_update("3/3/3", rendered=True)
 
     def _save_ivy_lee_data(self):
+        if self._populating_widgets: return
         widgets = self.task_widgets["Ivy Lee Method"]["task_entries"]
         self.data["Ivy Lee Method"]["tasks"] = [{"title": w["entry"].text().strip(), "done": w["checkbox"].isChecked()} for w in widgets]
         self.data["Ivy Lee Method"]["notes"] = self.task_widgets["Ivy Lee Method"]["notes_editor"].toPlainText()
-        self._save_and_update()
+        self._save_and_update("Ivy Lee Method", rendered=True)
 
 
     # --- Dashboard and Pomodoro ---
@@ -802,14 +3400,7 @@ class ProductivityApp(QMainWindow):
         self.dash_status_label.setText(f"Current Status: {status}")
         stats_text = "<b>Task Statistics</b><br><br>"
         total, completed = 0, 0
-        methods = {
-            "Todo List": (len(self.data["Todo List"]["tasks"]), sum(1 for t in self.data["Todo List"]["tasks"] if t.get("done"))),
-            "Eat the Frog": ((1 if self.data["Eat the Frog"]["frog"]["title"] else 0) + len(self.data["Eat the Frog"]["other_tasks"]), (1 if self.data["Eat the Frog"]["frog"]["done"] else 0) + sum(1 for t in self.data["Eat the Frog"]["other_tasks"] if t.get("done"))),
-            "Eisenhower": (sum(len(q) for q in self.data["Eisenhower"].values()), sum(sum(1 for t in q if t.get("done")) for q in self.data["Eisenhower"].values())),
-            "3/3/3": (sum(len([t for t in c if t.get("title")]) for c in self.data["3/3/3"].values()), sum(sum(1 for t in c if t.get("done")) for c in self.data["3/3/3"].values())),
-            "Ivy Lee Method": (len([t for t in self.data["Ivy Lee Method"]["tasks"] if t.get("title")]), sum(1 for t in self.data["Ivy Lee Method"]["tasks"] if t.get("done")))
-        }
-        for name, (count, done) in methods.items():
+        for name, (count, done) in completion_counts(self.data).items():
             if count > 0:
                 stats_text += f"&bull; <b>{name}:</b> {done} of {count} complete.<br>"
                 total, completed = total + count, completed + done
@@ -817,6 +3408,15 @@ class ProductivityApp(QMainWindow):
         stats_text += f"<hr><b>Overall:</b> {completed} of {total} complete ({progress:.0f}%)"
         self.dash_stats_label.setText(stats_text)
 
+    def _update_completion_history(self):
+        self._record_history()
+        rows = []
+        for date, completed, total in self.history.daily_completion(HISTORY_DASHBOARD_DAYS):
+            percent = completed / total * 100 if total else 0
+            bar = "█" * round(percent / 5) + "░" * (20 - round(percent / 5))
+            rows.append(f"{date:%a %d %b}  {bar} {percent:3.0f}%  ({completed}/{total})")
+        self.dash_history_label.setText(f"<b>Daily Completion (last {HISTORY_DASHBOARD_DAYS} days)</b><pre>{chr(10).join(rows)}</pre>")
+
     def _update_pomodoro_timer(self):
         if self.pomodoro_timer_running and self.pomodoro_time > 0:
             self.pomodoro_time -= 1
@@ -827,16 +3427,19 @@ class ProductivityApp(QMainWindow):
                 pass
             self._stop_pomodoro()
         self._update_dashboard()
+        self._mark_api_dirty("pomodoro")
 
     def _start_pomodoro(self):
         if not self.pomodoro_timer_running:
             self.pomodoro_timer_running = True
             self.pomodoro_timer.start(1000)
+            self._mark_api_dirty("pomodoro")
 
     def _stop_pomodoro(self):
         self.pomodoro_timer_running = False
         self.pomodoro_timer.stop()
         self._update_dashboard()
+        self._mark_api_dirty("pomodoro")
 
     def _reset_pomodoro(self):
         self._stop_pomodoro()
@@ -844,10 +3447,485 @@ class ProductivityApp(QMainWindow):
         self.pomodoro_label.setText("25:00")
         self._update_dashboard()
 
+    # --- Task History ---
+    def _collect_changes(self, undoable=True):
+        """Diffs the changed sections against change_base, queueing the ops for history and,
+        if `undoable`, adding them to the undo log as one step."""
+        self.change_timer.stop()
+        sections = sorted(self.change_dirty_sections)
+        self.change_dirty_sections.clear()
+        forward, inverse = [], []
+        for section in sections:
+            forward.extend(diff_json(self.change_base.get(section), self.data.get(section), (section,)))
+            inverse.extend(diff_json(self.data.get(section), self.change_base.get(section), (section,)))
+        if not forward:
+            return
+        # The ops still point into the live data and change_base, which keep changing
+        forward, inverse = copy.deepcopy(forward), copy.deepcopy(inverse)
+        apply_json_ops(self.change_base, forward)
+        self._queue_history(forward)
+        changed_sections = {op[1][0] for op in forward}
+        if undoable:
+            self.undo_log.record(forward, inverse, changed_sections)
+        else:
+            self.undo_log.drop_sections(changed_sections)
+        self._update_undo_actions()
+
+    def _queue_history(self, ops):
+        # Recorded after a short pause, so a burst of typing becomes one delta
+        self.history_pending_ops.extend(ops)
+        if not self.history_timer.isActive():
+            self.history_timer.start()
+
+    def _record_history(self):
+        self._collect_changes()
+        self.history_timer.stop()
+        if self.history_pending_ops:
+            self.history.record(self.history_pending_ops, self.data)
+            self.history_pending_ops = []
+
+    # --- Undo / Redo ---
+    def _undo(self):
+        self._collect_changes()
+        step = self.undo_log.undo()
+        if step:
+            self._replay_step(step["inverse"], step["sections"])
+
+    def _redo(self):
+        self._collect_changes()
+        step = self.undo_log.redo()
+        if step:
+            self._replay_step(step["forward"], step["sections"])
+
+    def _replay_step(self, ops, sections):
+        try:
+            apply_json_ops(self.data, ops)
+            apply_json_ops(self.change_base, ops)
+        except (KeyError, IndexError, TypeError) as e:
+            # Only reachable if the data changed behind the log's back; start over from what's there now
+            logging.error(f"Could not replay undo step, clearing the undo history: {e}")
+            self.undo_log.clear()
+            self.change_base = copy.deepcopy(self.data)
+            sections = list(self.data)
+        else:
+            self._queue_history(ops)
+        for section in sections:
+            self._mark_changed(section)
+        # Both copies already hold the result, there is nothing left to diff
+        self.change_dirty_sections.difference_update(sections)
+        self._update_undo_actions()
+        self._load_tab_data(self.tab_widget.tabText(self.tab_widget.currentIndex()))
+        self._update_dashboard()
+
+    def _toggle_keep_undo_history(self, enabled):
+        self.settings["keep_undo_history"] = enabled
+
+    def _update_undo_actions(self):
+        self.undo_action.setEnabled(bool(self.undo_log.undo_steps))
+        self.redo_action.setEnabled(bool(self.undo_log.redo_steps))
+
+    def _save_undo_log(self):
+        """Writes the undo log next to the data if the user asked to keep it, otherwise removes any old one."""
+        with self.profile.undo_file.locked():
+            if self.settings.get("keep_undo_history", False):
+                self.profile.undo_file.write(self.undo_log.to_json(self.data))
+            elif os.path.exists(self.profile.undo_file.file_path):
+                os.remove(self.profile.undo_file.file_path)
+
+    # --- Daily Rollover ---
+    def _check_rollover(self):
+        """Archives the previous day once the date has moved on, then re-arms the timer for the next midnight."""
+        if self.loading_parts:
+            return
+        today = datetime.date.today()
+        active_day = self.settings.get("active_day")
+        if active_day is None:
+            self.settings["active_day"] = today.isoformat()
+        elif active_day < today.isoformat():
+            self._roll_over(active_day)
+            self.settings["active_day"] = today.isoformat()
+            self.settings = self.settings_file.save(self.settings)
+        self._materialize_recurring()
+        next_midnight = datetime.datetime.combine(today + datetime.timedelta(days=1), datetime.time.min)
+        delay = (next_midnight - datetime.datetime.now()).total_seconds() * 1000
+        self.rollover_timer.start(max(int(delay), 0) + ROLLOVER_SLACK_MS)
+
+    def _roll_over(self, day):
+        self._collect_changes()
+        snapshot, remaining = roll_over_data(self.data)
+        if _has_content(snapshot):
+            self.archive.add_day(day, snapshot)
+        previous, self.data = self.data, remaining
+        for section in self.data:
+            if self.data[section] != previous.get(section):
+                self._mark_changed(section)
+        self._collect_changes(undoable=False)
+        # Saved right away so the live file stays small even if the app is never closed
+        self.data = self.data_file.save(self.data)
+        self._load_tab_data(self.tab_widget.tabText(self.tab_widget.currentIndex()))
+        self._update_dashboard()
+        logging.info(f"Rolled over {day} into the archive.")
+
+    # --- Recurring Tasks ---
+    def _materialize_recurring(self, undoable=False):
+        """Adds the active day's recurring tasks, each rule at most once per day."""
+        day = datetime.date.fromisoformat(self.settings["active_day"])
+        recurring = self.profile.recurring
+        recurring.pull()
+        due = recurring.due(day)
+        if not due:
+            return
+        items = [item for rule in due for item in recurring.rule_items(rule)]
+        recurring.mark_materialized(due, day)
+        recurring.save()
+        self._add_recurring_items(items, undoable)
+
+    def _add_recurring_items(self, items, undoable=True):
+        """Adds template or rule items to today's lists, skipping any still open (e.g. carried over from yesterday)."""
+        self._collect_changes()
+        changed_sections = set()
+        for item in items:
+            try:
+                tasks, fixed_slots = self._api_task_list(self.data, item.get("list"))
+            except ValueError:
+                continue
+            title = str(item.get("title", "")).strip()
+            if not title or any(task.get("title") == title and not task.get("done") for task in tasks):
+                continue
+            task = {"title": title, "done": False}
+            if item["list"] == "todo":
+                task["priority"] = item.get("priority", "Medium")
+            if fixed_slots:
+                free_slot = next((index for index, slot in enumerate(tasks) if not slot.get("title")), None)
+                if free_slot is None:
+                    continue
+                tasks[free_slot] = task
+            else:
+                tasks.append(task)
+            changed_sections.add(API_DATA_SECTIONS[item["list"].partition("/")[0]])
+        if not changed_sections:
+            return
+        for section in changed_sections:
+            self._mark_changed(section)
+        self._collect_changes(undoable=undoable)
+        self.data = self.data_file.save(self.data)
+        self._load_tab_data(self.tab_widget.tabText(self.tab_widget.currentIndex()))
+        self._update_dashboard()
+
+    def _day_template_items(self):
+        """Today's titled tasks in every list, as items for a day template."""
+        items = []
+        for name in RECURRING_LISTS:
+            tasks, _ = self._api_task_list(self.data, name)
+            for task in tasks:
+                if task.get("title"):
+                    item = {"list": name, "title": task["title"]}
+                    if name == "todo":
+                        item["priority"] = task.get("priority", "Medium")
+                    items.append(item)
+        return items
+
+    def changeEvent(self, event):
+        # Timers don't run while the machine sleeps, so check again whenever the window comes back
+        if event.type() == QEvent.Type.ActivationChange and self.isActiveWindow():
+            if self.settings.get("active_day", "") < datetime.date.today().isoformat():
+                self._check_rollover()
+        super().changeEvent(event)
+
+    # --- Local API ---
+    def _toggle_api_server(self, enabled):
+        self.settings["api_enabled"] = enabled
+        if enabled:
+            self._start_api_server()
+        else:
+            self._stop_api_server()
+
+    def _start_api_server(self):
+        if self.api_server:
+            return
+        server = LocalApiServer(self.api_bridge, self.settings.get("api_port", API_DEFAULT_PORT), self._api_token())
+        if not server.start():
+            QMessageBox.warning(self, "Local API", f"Could not start the local API on port {server.port}.")
+            self.api_action.setChecked(False)
+            return
+        self.api_server = server
+        self.api_dirty_sections.update(API_SECTIONS)
+        self._publish_api_state()
+
+    def _api_token(self):
+        """The profile's API token, created (and saved, so clients can read it) on first use."""
+        if not self.settings.get("api_token"):
+            self.settings["api_token"] = secrets.token_urlsafe(24)
+            self.settings = self.settings_file.save(self.settings)
+        return self.settings["api_token"]
+
+    def _copy_api_token(self):
+        QApplication.clipboard().setText(self._api_token())
+        self.statusBar().showMessage("API token copied to the clipboard.", 3000)
+
+    def _stop_api_server(self):
+        if self.api_server:
+            self.api_server.stop()
+            self.api_server = None
+        self.api_publish_timer.stop()
+        self.api_dirty_sections.clear()
+
+    def _mark_api_dirty(self, *sections):
+        # Changes are coalesced so a burst of edits (e.g. typing) is encoded and published once
+        if self.api_server is None:
+            return
+        self.api_dirty_sections.update(sections)
+        if not self.api_publish_timer.isActive():
+            self.api_publish_timer.start()
+
+    def _api_section(self, slug):
+        if slug in API_DATA_SECTIONS:
+            return self.data[API_DATA_SECTIONS[slug]]
+        if slug == "pomodoro":
+            return {"running": self.pomodoro_timer_running, "remaining_seconds": self.pomodoro_time}
+        return self.rpg_history
+
+    def _publish_api_state(self):
+        self.api_publish_timer.stop()
+        if self.api_server and self.api_dirty_sections:
+            self.api_server.publish({slug: self._api_section(slug) for slug in self.api_dirty_sections})
+        self.api_dirty_sections.clear()
+
+    def _api_task_list(self, data, target):
+        """Resolves a batch operation's "list" (e.g. "todo", "eisenhower/do", "333/outcomes") to (list, is_fixed_slots)."""
+        section, _, key = str(target).partition("/")
+        if section == "todo":
+            return data["Todo List"]["tasks"], False
+        if section == "frog":
+            return data["Eat the Frog"]["other_tasks"], False
+        if section == "eisenhower" and key in data["Eisenhower"]:
+            return data["Eisenhower"][key], False
+        if section == "333" and key in data["3/3/3"]:
+            return data["3/3/3"][key], True
+        if section == "ivy-lee":
+            return data["Ivy Lee Method"]["tasks"], True
+        raise ValueError(f"unknown list '{target}'")
+
+    @staticmethod
+    def _api_task_index(op, tasks):
+        index = int(op["index"])
+        if not 0 <= index < len(tasks):
+            raise ValueError(f"index {index} is out of range")
+        return index
+
+    def _apply_api_operation(self, data, op, rpg_entries, deferred):
+        kind = op.get("op")
+        if kind in ("add", "update", "delete", "move"):
+            tasks, fixed_slots = self._api_task_list(data, op.get("list"))
+            is_todo = op.get("list") == "todo"
+            if kind == "add":
+                title = str(op.get("title", "")).strip()
+                if fixed_slots or not title:
+                    raise ValueError("'add' needs a non-empty title and a list that isn't fixed-size")
+                task = {"title": title, "done": bool(op.get("done", False))}
+                if is_todo:
+                    task["priority"] = op.get("priority", "Medium")
+                    if task["priority"] not in TODO_PRIORITIES:
+                        raise ValueError(f"priority must be one of {', '.join(TODO_PRIORITIES)}")
+                tasks.append(task)
+                return
+            index = self._api_task_index(op, tasks)
+            task = tasks[index]
+            if kind == "update":
+                if "title" in op:
+                    task["title"] = str(op["title"]).strip()
+                if "done" in op:
+                    task["done"] = bool(op["done"])
+                if is_todo and "priority" in op:
+                    if op["priority"] not in TODO_PRIORITIES:
+                        raise ValueError(f"priority must be one of {', '.join(TODO_PRIORITIES)}")
+                    task["priority"] = op["priority"]
+                return
+            if fixed_slots:
+                raise ValueError(f"'{kind}' is not possible on a fixed-size list")
+            tasks.pop(index)
+            if kind == "move":
+                to_tasks, to_fixed_slots = self._api_task_list(data, op.get("to"))
+                if to_fixed_slots:
+                    raise ValueError("cannot move a task into a fixed-size list")
+                moved = {"title": task["title"], "done": task["done"]}
+                if op.get("to") == "todo":
+                    moved["priority"] = task.get("priority", "Medium")
+                to_tasks.append(moved)
+        elif kind == "set_frog":
+            frog = data["Eat the Frog"]["frog"]
+            frog.update({"title": str(op.get("title", frog["title"])), "done": bool(op.get("done", frog["done"]))})
+        elif kind == "set_notes":
+            data["Ivy Lee Method"]["notes"] = str(op["notes"])
+        elif kind == "pomodoro":
+            if op.get("action") not in ("start", "stop", "reset"):
+                raise ValueError("pomodoro action must be 'start', 'stop' or 'reset'")
+            deferred.append(lambda action=op["action"]: getattr(self, f"_{action}_pomodoro")())
+        elif kind == "log_rpg":
+            date = datetime.date.fromisoformat(op.get("date") or datetime.date.today().isoformat()).isoformat()
+            stats = {key: int(value) for key, value in dict(op["stats"]).items()}
+            if any(key not in self.STATS or not 0 <= value <= 10 for key, value in stats.items()):
+                raise ValueError(f"stats must map {', '.join(self.STATS)} to values from 0 to 10")
+            rpg_entries.setdefault(date, {}).update(stats)
+        else:
+            raise ValueError(f"unknown op '{kind}'")
+
+    def _apply_api_batch(self, operations, future):
+        """Applies a whole batch or none of it, then refreshes the UI and saves once."""
+        if not future.set_running_or_notify_cancel():
+            return
+        data, rpg_entries, deferred = copy.deepcopy(self.data), {}, []
+        for number, op in enumerate(operations):
+            try:
+                if not isinstance(op, dict):
+                    raise ValueError("each operation must be a JSON object")
+                self._apply_api_operation(data, op, rpg_entries, deferred)
+            except (KeyError, IndexError, TypeError, ValueError) as e:
+                future.set_exception(ValueError(f"Operation {number} failed ({e!r}); nothing was applied."))
+                return
+        # The stats file is the only write that can fail outright, so it goes first: if it does, the tasks are untouched too
+        if rpg_entries:
+            try:
+                self._write_rpg_stats(rpg_entries)
+            except OSError as e:
+                future.set_exception(ApiError(500, f"{e}; nothing was applied."))
+                return
+        try:
+            previous, self.data = self.data, self.data_file.save(data)
+            for section in self.data:
+                if self.data[section] != previous.get(section):
+                    self._mark_changed(section)
+            for action in deferred:
+                action()
+            self._load_tab_data(self.tab_widget.tabText(self.tab_widget.currentIndex()))
+            self._update_dashboard()
+            self._publish_api_state()
+        except Exception as e:
+            # Resolve the future whatever happens, or the client waits forever
+            logging.exception("Error applying an API batch")
+            future.set_exception(ApiError(500, f"Error applying the batch: {e!r}"))
+            return
+        future.set_result({"applied": len(operations)})
+
+    # --- Profiles ---
+    def _update_window_title(self):
+        self.setWindowTitle(f"Personal Growth Dashboard - {self.profile.name}")
+
+    def _populate_profile_menu(self):
+        self.profile_menu.clear()
+        group = QActionGroup(self.profile_menu)
+        selected = self.pending_profile or self.profile.name
+        for name in list_profiles():
+            action = QAction(name, group, checkable=True)
+            action.setChecked(name == selected)
+            action.triggered.connect(lambda _, n=name: self._switch_profile(n))
+            self.profile_menu.addAction(action)
+        self.profile_menu.addSeparator()
+        new_action = QAction("&New Profile...", self.profile_menu)
+        new_action.triggered.connect(self._create_profile)
+        self.profile_menu.addAction(new_action)
+
+    def _create_profile(self):
+        name, ok = QInputDialog.getText(self, "New Profile", "Name for the new profile:")
+        name = name.strip()
+        if not ok or not name:
+            return
+        if not PROFILE_NAME_PATTERN.fullmatch(name):
+            QMessageBox.warning(self, "New Profile", "Use up to 40 letters, digits, spaces, dots, dashes or apostrophes, "
+                                "not ending in a dot or space.")
+            return
+        if name.partition(".")[0].strip().upper() in RESERVED_FILE_NAMES:
+            QMessageBox.warning(self, "New Profile", f"'{name}' is reserved by the system; choose another name.")
+            return
+        if name.casefold() in {existing.casefold() for existing in list_profiles()}:
+            QMessageBox.warning(self, "New Profile", f"A profile called '{name}' already exists.")
+            return
+        # The profiles folder also holds profiles.json, which list_profiles() doesn't show
+        if os.path.exists(profile_directory(name)):
+            QMessageBox.warning(self, "New Profile", f"'{name}' is already in use in the profiles folder; choose another name.")
+            return
+        try:
+            os.makedirs(profile_directory(name))
+        except OSError as e:
+            logging.error(f"Error creating profile folder for '{name}': {e}")
+            QMessageBox.warning(self, "New Profile", f"Could not create the profile '{name}':\n{e}")
+            return
+        self._switch_profile(name)
+
+    def _switch_profile(self, name):
+        """Switches at once if the profile is cached, otherwise loads it in the background first."""
+        if self.loading_parts:
+            return
+        if name == self.profile.name:
+            self.pending_profile = None
+            self.statusBar().clearMessage()
+            return
+        state = self.profile_cache.get(name)
+        if state is None:
+            self.pending_profile = name
+            self.statusBar().showMessage(f"Loading profile '{name}'...")
+            self.profile_loader.request(name, self._get_default_data(), self.STATS)
+            return
+        self.pending_profile = None
+        self._activate_profile(state)
+
+    def _on_profile_loaded(self, name, future):
+        self.profile_loader.pending.discard(name)
+        try:
+            state = future.result()
+        except concurrent.futures.CancelledError:
+            return
+        except (OSError, ValueError) as e:
+            logging.error(f"Could not load profile {name!r}: {e}")
+            if name == self.pending_profile:
+                self.pending_profile = None
+                self.statusBar().clearMessage()
+                QMessageBox.warning(self, "Profiles", f"Could not load profile '{name}':\n{e}")
+            return
+        self.profile_cache.put(state)
+        if name == self.pending_profile:
+            self.pending_profile = None
+            self._activate_profile(state)
+
+    def _activate_profile(self, state):
+        """Saves the current profile, then swaps every per-profile attribute over to `state`."""
+        self._record_history()
+        self.data = self.data_file.save(self.data)
+        self.settings = self.settings_file.save(self.settings)
+        self._save_undo_log()
+        watched = self.file_watcher.files() + self.file_watcher.directories()
+        if watched:
+            self.file_watcher.removePaths(watched)
+        previous_theme = self.settings.get("theme")
+
+        self.profile = state
+        self.profile_cache.put(state)
+        with self.profiles_file.locked():
+            self.profiles_file.write({"active": state.name})
+        self.statusBar().clearMessage()
+        self._update_window_title()
+        if self.settings.get("theme", "dark") != previous_theme:
+            self._set_theme(self.settings.get("theme", "dark"))
+        self.api_action.setChecked(self.settings.get("api_enabled", False))
+        if self.api_server:
+            self.api_server.token = self._api_token()
+        for section in list(self.data) + ["RPG Stats"]:
+            self._mark_changed(section)
+        self.change_dirty_sections.clear()
+        self.keep_undo_action.setChecked(self.settings.get("keep_undo_history", False))
+        self._update_undo_actions()
+        # A cached profile may have been edited elsewhere while it wasn't active
+        self._sync_external_changes()
+        self._check_rollover()
+        self._load_tab_data(self.tab_widget.tabText(self.tab_widget.currentIndex()))
+        logging.info(f"Switched to profile {state.name!r}.")
+
     # --- App-level Actions ---
     def _clear_all_tasks(self):
-        if QMessageBox.question(self, 'Clear All Tasks', "Are you sure you want to delete all data? This cannot be undone.", QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No, QMessageBox.StandardButton.No) == QMessageBox.StandardButton.Yes:
+        if QMessageBox.question(self, 'Clear All Tasks', "Are you sure you want to delete all data? You can bring it back with Edit → Undo.", QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No, QMessageBox.StandardButton.No) == QMessageBox.StandardButton.Yes:
             self.data = self._get_default_data()
+            for section in self.data:
+                self._mark_changed(section)
             self._on_tab_change(self.tab_widget.currentIndex())
 
     def _show_about_dialog(self):
@@ -869,8 +3947,18 @@ class ProductivityApp(QMainWindow):
             """
         )
     def closeEvent(self, event):
-        self._save_json(self.data, DATA_FILE)
-        self._save_json(self.settings, SETTINGS_FILE)
+        self._record_history()
+        self.rollover_timer.stop()
+        self._stop_api_server()
+        self.file_sync_timer.stop()
+        self.profile_loader.shutdown()
+        # Anything still loading was never shown, so there is nothing of it to save
+        if "data" not in self.loading_parts:
+            self.data = self.data_file.save(self.data)
+        if "settings" not in self.loading_parts:
+            self.settings = self.settings_file.save(self.settings)
+        if not self.loading_parts:
+            self._save_undo_log()
         event.accept()
 SHARED_STYLES = """
     QGroupBox { font-weight: bold; background-image: none; }
@@ -924,7 +4012,6 @@ SHARED_STYLES = """
 LIGHT_STYLESHEET = SHARED_STYLES + """
     QMainWindow, QDialog { background-color: #f0f0f0; }
     QWidget { color: #111; font-family: "Segoe UI", sans-serif; font-size: 10pt; background-image: none; }
-    QWidget#scrollListContent { background-color: #ffffff; }
     QListWidget { border-radius: 5px; }
     QTabWidget::pane { border: 1px solid #d0d0d0; }
     QTabBar::tab { background-color: #e0e0e0; color: #333; padding: 10px 20px; border: 1px solid #d0d0d0; border-bottom: none; }
@@ -933,7 +4020,7 @@ LIGHT_STYLESHEET = SHARED_STYLES + """
     QLabel#headerLabel { color: #3f51b5; font-size: 14pt; font-weight: bold; }
     QPushButton { background-color: #3f51b5; color: white; }
     QPushButton:disabled { background-color: #cccccc; color: #888888; border: 1px solid #bbbbbb; }
-    QLineEdit, QTextEdit, QScrollArea, QListWidget, QComboBox, QSpinBox { background-color: #ffffff; border: 1px solid #d0d0d0; border-radius: 4px; padding: 5px; color: #111; }
+    QLineEdit, QTextEdit, QListWidget, QComboBox, QSpinBox { background-color: #ffffff; border: 1px solid #d0d0d0; border-radius: 4px; padding: 5px; color: #111; }
     QMenuBar { background-color: #e0e0e0; color: #333; }
     QMenuBar::item:selected { background-color: #3f51b5; color: white; }
     QMenu { background-color: #f0f0f0; border: 1px solid #d0d0d0; }
@@ -953,7 +4040,6 @@ LIGHT_STYLESHEET = SHARED_STYLES + """
 DARK_STYLESHEET = SHARED_STYLES + """
     QMainWindow, QDialog { background-color: #212121; }
     QWidget { color: #eee; font-family: "Segoe UI", sans-serif; font-size: 10pt; background-image: none; }
-    QWidget#scrollListContent { background-color: #2c2c2c; }
     QListWidget { border-radius: 5px; }
     QTabWidget::pane { border: 1px solid #3a3a3a; }
     QTabBar::tab { background-color: #2c2c2c; color: #ccc; padding: 10px 20px; border: 1px solid #3a3a3a; border-bottom: none; }
@@ -963,7 +4049,7 @@ DARK_STYLESHEET = SHARED_STYLES + """
     QLabel#headerLabel { color: #3f51b5; font-size: 14pt; font-weight: bold; }
     QPushButton { background-color: #3f51b5; color: white; }
     QPushButton:disabled { background-color: #444444; color: #888888; border: 1px solid #555555; }
-    QLineEdit, QTextEdit, QScrollArea, QListWidget, QComboBox, QSpinBox { background-color: #2c2c2c; border: 1px solid #3a3a3a; border-radius: 4px; padding: 5px; color: #eee; }
+    QLineEdit, QTextEdit, QListWidget, QComboBox, QSpinBox { background-color: #2c2c2c; border: 1px solid #3a3a3a; border-radius: 4px; padding: 5px; color: #eee; }
     QComboBox::drop-down { border: none; }
     QComboBox QAbstractItemView { background-color: #3a3a3a; color: #eee; selection-background-color: #3f51b5; }
     QMenuBar { background-color: #2c2c2c; color: #ccc; }
@@ -982,7 +4068,171 @@ DARK_STYLESHEET = SHARED_STYLES + """
     }
 """
 
+# --- Soak Test ---
+SOAK_DEFAULT_CYCLES = 2000
+SOAK_WARMUP_CYCLES = 100
+SOAK_REPORT_EVERY = 200
+SOAK_THEME_TOGGLE_EVERY = 10
+SOAK_RPG_LOG_EVERY = 25
+SOAK_PROFILE_SWITCH_EVERY = 50
+# More profiles than the cache holds, so background loading and eviction both get exercised
+SOAK_PROFILES = PROFILE_CACHE_SIZE + 2
+# Allowed growth between the end of the warm-up and the last cycle
+SOAK_MAX_GROWTH = {"python_bytes": 2 * 1024 * 1024, "qobjects": 50, "widgets": 50, "figures": 0}
+
+
+def soak_measure(window):
+    """Traced Python memory, QObjects under the window, all live widgets and matplotlib figures."""
+    gc.collect()
+    figure_type = getattr(sys.modules.get("matplotlib.figure"), "Figure", None)
+    return {
+        "python_bytes": tracemalloc.get_traced_memory()[0],
+        "qobjects": len(window.findChildren(QObject)),
+        "widgets": len(QApplication.allWidgets()),
+        # type() rather than isinstance(): isinstance() reads __class__, which makes plyer's lazy proxies import their backends
+        "figures": sum(issubclass(type(obj), figure_type) for obj in gc.get_objects()) if figure_type else 0,
+    }
+
+
+def _soak_cycle(app, window, cycle, entry, priority_combo):
+    """One scripted round of what a user does all day, through the same widgets and slots."""
+    tabs = window.tab_widget
+    tab_names = [tabs.tabText(i) for i in range(tabs.count())]
+
+    if cycle % SOAK_PROFILE_SWITCH_EVERY == 0:
+        name = f"Soak {cycle // SOAK_PROFILE_SWITCH_EVERY % SOAK_PROFILES}"
+        os.makedirs(profile_directory(name), exist_ok=True)
+        window._switch_profile(name)
+        while window.pending_profile:
+            app.processEvents(QEventLoop.ProcessEventsFlag.WaitForMoreEvents)
+
+    tabs.setCurrentIndex(tab_names.index("Todo List"))
+    entry.setText(f"Soak task {cycle}")
+    priority_combo.setCurrentIndex(cycle % len(TODO_PRIORITIES))
+    window._add_todo_task(entry, priority_combo)
+    todo_list = window.task_widgets["Todo List"]["list"]
+    todo_list.itemWidget(todo_list.item(todo_list.count() - 1)).findChild(QCheckBox).setChecked(True)
+    todo_list.itemWidget(todo_list.item(todo_list.count() - 1)).findChild(QPushButton, "deleteButton").click()
+
+    tabs.setCurrentIndex(tab_names.index("Eat the Frog"))
+    entry.setText(f"Soak frog task {cycle}")
+    window._add_other_frog_task(entry)
+    frog_list = window.task_widgets["Eat the Frog"]["other_tasks_list"]
+    frog_list.itemWidget(frog_list.item(frog_list.count() - 1)).findChild(QCheckBox).setChecked(True)
+    frog_list.itemWidget(frog_list.item(frog_list.count() - 1)).findChild(QPushButton, "deleteButton").click()
+
+    tabs.setCurrentIndex(tab_names.index("Eisenhower"))
+    entry.setText(f"Soak quadrant task {cycle}")
+    window._add_eisenhower_task(entry)
+    window._apply_bulk_action({"eisenhower/do": {len(window.data["Eisenhower"]["do"]) - 1}}, "move", "eisenhower/delete")
+    window._apply_bulk_action({"eisenhower/delete": {len(window.data["Eisenhower"]["delete"]) - 1}}, "delete")
+    window._undo()
+    window._redo()
+
+    if cycle % SOAK_RPG_LOG_EVERY == 0:
+        # Cycles through a fixed month of dates, so the stats file itself stays the same size
+        date = datetime.date.today() - datetime.timedelta(days=cycle // SOAK_RPG_LOG_EVERY % 30)
+        window._write_rpg_stats({date.isoformat(): {key: (cycle + i) % 11 for i, key in enumerate(window.STATS)}})
+        window._export_rpg_wallpaper()
+    if cycle % SOAK_THEME_TOGGLE_EVERY == 0:
+        window._toggle_theme()
+    for index in range(tabs.count()):
+        tabs.setCurrentIndex(index)
+
+    app.processEvents()
+    # deleteLater() only runs when control returns to an event loop, which a scripted run never does
+    app.sendPostedEvents(None, QEvent.Type.DeferredDelete.value)
+
+
+def soak_check_sync_merge(directory):
+    """Two instances sharing a data file: an in-place edit made after pulling the
+    other's change must survive the other's next save. Returns whether it did."""
+    path = os.path.join(directory, "sync_check.json")
+    default = {"Eat the Frog": {"frog": {"title": "", "done": False}, "other_tasks": []}}
+    ours, theirs = SyncedJsonFile(path), SyncedJsonFile(path)
+    ours_data = ours.save(ours.load(default))
+    theirs_data = theirs.load(default)
+    theirs_data["Eat the Frog"]["other_tasks"].append({"title": "theirs 1", "done": False})
+    theirs_data = theirs.save(theirs_data)
+    ours_data, _ = ours.pull(ours_data)
+    # The app edits its data in place, like _save_eat_the_frog_data() does
+    ours_data["Eat the Frog"]["frog"]["title"] = "ours"
+    theirs_data["Eat the Frog"]["other_tasks"].append({"title": "theirs 2", "done": False})
+    theirs.save(theirs_data)
+    ours.save(ours_data)
+    with open(path) as f:
+        return json.load(f)["Eat the Frog"]["frog"]["title"] == "ours"
+
+
+@contextlib.contextmanager
+def _data_root(directory):
+    """Points the default profile and the profiles folder at `directory` until the block exits."""
+    global DEFAULT_PROFILE_DIR, PROFILES_DIR, PROFILES_FILE
+    saved = DEFAULT_PROFILE_DIR, PROFILES_DIR, PROFILES_FILE
+    DEFAULT_PROFILE_DIR = directory
+    PROFILES_DIR = os.path.join(directory, "profiles")
+    PROFILES_FILE = os.path.join(PROFILES_DIR, "profiles.json")
+    try:
+        yield
+    finally:
+        DEFAULT_PROFILE_DIR, PROFILES_DIR, PROFILES_FILE = saved
+
+
+def run_soak_test(cycles=SOAK_DEFAULT_CYCLES):
+    """Drives the app headlessly through scripted cycles and fails if memory or object counts keep growing.
+
+    Runs against a throwaway data directory, so real data is never touched. Returns the
+    process exit code: 1 if any measure grew past SOAK_MAX_GROWTH after the warm-up.
+    """
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    app = QApplication.instance() or QApplication(sys.argv)
+    with tempfile.TemporaryDirectory(prefix="dashboard-soak-") as data_dir, _data_root(data_dir):
+        if not soak_check_sync_merge(data_dir):
+            logging.error("Soak test FAILED: an edit made after merging another instance's changes was lost on save.")
+            return 1
+
+        window = ProductivityApp()
+        window.show()
+        while window.loading_parts:
+            app.processEvents(QEventLoop.ProcessEventsFlag.WaitForMoreEvents)
+        entry, priority_combo = QLineEdit(), QComboBox()
+        priority_combo.addItems(TODO_PRIORITIES)
+        warmup = min(SOAK_WARMUP_CYCLES, cycles // 10)
+        tracemalloc.start()
+        for cycle in range(warmup):
+            _soak_cycle(app, window, cycle, entry, priority_combo)
+        # Snapshot first: the snapshot itself is traced, so it has to be part of the baseline
+        baseline_snapshot = tracemalloc.take_snapshot()
+        baseline = soak_measure(window)
+        logging.info(f"Soak test: baseline after {warmup} warm-up cycles: {baseline}")
+        for cycle in range(warmup, cycles):
+            _soak_cycle(app, window, cycle, entry, priority_combo)
+            if (cycle + 1) % SOAK_REPORT_EVERY == 0:
+                logging.info(f"Soak test: cycle {cycle + 1}/{cycles}: {soak_measure(window)}")
+        final = soak_measure(window)
+        top_allocations = tracemalloc.take_snapshot().compare_to(baseline_snapshot, "lineno")[:10]
+        tracemalloc.stop()
+        window.close()
+
+    exceeded = [key for key, limit in SOAK_MAX_GROWTH.items() if final[key] - baseline[key] > limit]
+    for key in SOAK_MAX_GROWTH:
+        logging.info(f"Soak test: {key} grew by {final[key] - baseline[key]} (limit {SOAK_MAX_GROWTH[key]})")
+    if exceeded:
+        logging.error(f"Soak test FAILED: {', '.join(exceeded)} grew past the limit. Largest Python allocation growth:")
+        for stat in top_allocations:
+            logging.error(f"  {stat}")
+        return 1
+    logging.info("Soak test passed.")
+    return 0
+
+
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Personal Growth Dashboard")
+    parser.add_argument("--soak", type=int, nargs="?", const=SOAK_DEFAULT_CYCLES, metavar="CYCLES",
+                        help=f"run a headless leak test for CYCLES scripted cycles (default {SOAK_DEFAULT_CYCLES}) and exit")
+    args, _ = parser.parse_known_args()
+    if args.soak:
+        sys.exit(run_soak_test(args.soak))
     app = QApplication(sys.argv)
     window = ProductivityApp()
     window.show()
@@ -0,0 +1,308 @@
+"""Tests for the pure data helpers: merging, diff ops, the undo log, XP and recurrence."""
+import copy
+import datetime
+import os
+import random
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import productivity_dashboard as dashboard  # noqa: E402
+
+STATS = ["ATK", "DEF", "INT"]
+
+
+def default_data():
+    return {
+        "Eat the Frog": {"frog": {"title": "", "done": False}, "other_tasks": []},
+        "Eisenhower": {"do": [], "schedule": [], "delegate": [], "delete": []},
+        "Todo List": {"tasks": [], "filter": "all"},
+        "3/3/3": {key: [{"title": "", "done": False} for _ in range(3)] for key in ("outcomes", "deep_work", "maintenance")},
+        "Ivy Lee Method": {"tasks": [{"title": "", "done": False} for _ in range(6)], "notes": ""},
+    }
+
+
+def task(title, done=False):
+    return {"title": title, "done": done, "priority": "Medium"}
+
+
+# --- merge_documents ---
+def test_merge_keeps_edits_from_both_sides():
+    base = default_data()
+    base["Todo List"]["tasks"] = [task("a"), task("b")]
+    ours, theirs = copy.deepcopy(base), copy.deepcopy(base)
+    ours["Todo List"]["tasks"].append(task("ours"))
+    theirs["Todo List"]["tasks"][0]["done"] = True
+    theirs["Ivy Lee Method"]["notes"] = "theirs"
+
+    merged = dashboard.merge_documents(base, ours, theirs)
+
+    assert [t["title"] for t in merged["Todo List"]["tasks"]] == ["a", "b", "ours"]
+    assert merged["Todo List"]["tasks"][0]["done"] is True
+    assert merged["Ivy Lee Method"]["notes"] == "theirs"
+
+
+def test_merge_keeps_sections_missing_on_one_side():
+    base = default_data()
+    ours = copy.deepcopy(base)
+    theirs = copy.deepcopy(base)
+    del theirs["Eisenhower"]
+    ours["Eisenhower"]["do"].append(task("urgent"))
+
+    merged = dashboard.merge_documents(base, ours, theirs)
+
+    assert merged["Eisenhower"]["do"] == [task("urgent")]
+
+
+def test_merge_fills_fixed_slots_by_position():
+    base = default_data()
+    ours, theirs = copy.deepcopy(base), copy.deepcopy(base)
+    ours["3/3/3"]["outcomes"][0]["title"] = "ours"
+    theirs["3/3/3"]["outcomes"][2]["title"] = "theirs"
+
+    merged = dashboard.merge_documents(base, ours, theirs)
+
+    assert [slot["title"] for slot in merged["3/3/3"]["outcomes"]] == ["ours", "", "theirs"]
+
+
+# --- diff_json / apply_json_ops ---
+def test_diff_ops_round_trip_on_random_edits():
+    rng = random.Random(1)
+    old = default_data()
+    for _ in range(300):
+        new = copy.deepcopy(old)
+        tasks = new["Todo List"]["tasks"]
+        choice = rng.randrange(5)
+        if choice == 0 or not tasks:
+            tasks.insert(rng.randint(0, len(tasks)), task(f"t{rng.random()}"))
+        elif choice == 1:
+            del tasks[rng.randrange(len(tasks))]
+        elif choice == 2:
+            tasks[rng.randrange(len(tasks))]["done"] ^= True
+        elif choice == 3:
+            new["3/3/3"]["deep_work"][rng.randrange(3)]["title"] = str(rng.random())
+        else:
+            new["Ivy Lee Method"]["notes"] += "x"
+
+        state = copy.deepcopy(old)
+        dashboard.apply_json_ops(state, dashboard.diff_json(old, new))
+        assert state == new
+        back = copy.deepcopy(new)
+        dashboard.apply_json_ops(back, dashboard.diff_json(new, old))
+        assert back == old
+        old = new
+
+
+def test_applied_values_are_copies():
+    old, new = default_data(), default_data()
+    new["Todo List"]["tasks"].append(task("a"))
+    ops = dashboard.diff_json(old, new)
+    dashboard.apply_json_ops(old, ops)
+    old["Todo List"]["tasks"][0]["title"] = "changed"
+    assert ops[0][4][0]["title"] == "a"
+
+
+def test_single_tick_is_one_small_op():
+    old = default_data()
+    old["Todo List"]["tasks"] = [task(str(i)) for i in range(1000)]
+    new = copy.deepcopy(old)
+    new["Todo List"]["tasks"][500]["done"] = True
+    assert dashboard.diff_json(old, new) == [["set", ["Todo List", "tasks", 500, "done"], True]]
+
+
+# --- OperationLog ---
+def record(log, old, new, section="Todo List"):
+    log.record(dashboard.diff_json(old, new), dashboard.diff_json(new, old), {section})
+
+
+def test_undo_redo_replays_ops():
+    log = dashboard.OperationLog()
+    first = default_data()
+    second = copy.deepcopy(first)
+    second["Todo List"]["tasks"].append(task("a"))
+    record(log, first, second)
+
+    state = copy.deepcopy(second)
+    dashboard.apply_json_ops(state, log.undo()["inverse"])
+    assert state == first
+    assert log.undo() is None
+    dashboard.apply_json_ops(state, log.redo()["forward"])
+    assert state == second
+    assert log.redo() is None
+
+
+def test_new_change_clears_redo():
+    log = dashboard.OperationLog()
+    first = default_data()
+    second = copy.deepcopy(first)
+    second["Todo List"]["tasks"].append(task("a"))
+    record(log, first, second)
+    log.undo()
+    record(log, first, copy.deepcopy(second))
+    assert log.redo_steps == []
+
+
+def test_typing_into_one_field_merges_into_one_step():
+    log = dashboard.OperationLog()
+    states = [default_data()]
+    for text in ("a", "ab", "abc"):
+        state = copy.deepcopy(states[-1])
+        state["Ivy Lee Method"]["notes"] = text
+        record(log, states[-1], state, "Ivy Lee Method")
+        states.append(state)
+
+    assert len(log.undo_steps) == 1
+    state = copy.deepcopy(states[-1])
+    dashboard.apply_json_ops(state, log.undo()["inverse"])
+    assert state["Ivy Lee Method"]["notes"] == ""
+
+
+def test_eviction_keeps_the_newest_steps(monkeypatch):
+    monkeypatch.setattr(dashboard, "UNDO_MAX_STEPS", 5)
+    log = dashboard.OperationLog()
+    old = default_data()
+    for i in range(8):
+        new = copy.deepcopy(old)
+        new["Todo List"]["tasks"].append(task(str(i)))
+        record(log, old, new)
+        old = new
+    assert len(log.undo_steps) == 5
+    assert log.size == sum(step["size"] for step in log.undo_steps)
+
+
+def test_drop_sections_forgets_steps_up_to_the_newest_touching_them():
+    log = dashboard.OperationLog()
+    data = default_data()
+    for section, path in (("Todo List", "filter"), ("Ivy Lee Method", "notes"), ("Todo List", "filter")):
+        new = copy.deepcopy(data)
+        new[section][path] = "changed" + section
+        record(log, data, new, section)
+        data = new
+    log.drop_sections({"Ivy Lee Method"})
+    assert [step["sections"] for step in log.undo_steps] == [["Todo List"]]
+
+
+def test_saved_log_only_loads_against_the_same_data():
+    log = dashboard.OperationLog()
+    old = default_data()
+    new = copy.deepcopy(old)
+    new["Todo List"]["tasks"].append(task("a"))
+    record(log, old, new)
+    saved = log.to_json(new)
+
+    assert len(dashboard.OperationLog.from_json(saved, new).undo_steps) == 1
+    assert len(dashboard.OperationLog.from_json(saved, old).undo_steps) == 0
+
+
+# --- XpEngine ---
+def random_history(rng, days):
+    start = datetime.date(2025, 1, 1)
+    history = {}
+    for offset in range(days):
+        if rng.random() < 0.8:
+            history[(start + datetime.timedelta(days=offset)).isoformat()] = {key: rng.randint(0, 10) for key in STATS}
+    return history
+
+
+def engine_state(engine):
+    return engine.dates, engine.checkpoints, engine.achievements
+
+
+def test_logging_a_day_matches_a_full_rebuild():
+    rng = random.Random(2)
+    history = random_history(rng, 60)
+    engine = dashboard.XpEngine.from_history(history, STATS)
+    history["2025-03-05"] = {key: 7 for key in STATS}
+    engine.update(history, "2025-03-05")
+    assert engine_state(engine) == engine_state(dashboard.XpEngine.from_history(history, STATS))
+
+
+def test_correcting_a_past_day_matches_a_full_rebuild():
+    rng = random.Random(3)
+    history = random_history(rng, 60)
+    engine = dashboard.XpEngine.from_history(history, STATS)
+    day = sorted(history)[10]
+    history[day] = {key: 10 for key in STATS}
+    engine.update(history, day)
+    assert engine_state(engine) == engine_state(dashboard.XpEngine.from_history(history, STATS))
+    del history[day]
+    engine.update(history, day)
+    assert engine_state(engine) == engine_state(dashboard.XpEngine.from_history(history, STATS))
+
+
+def test_sync_matches_a_full_rebuild():
+    rng = random.Random(4)
+    old = random_history(rng, 60)
+    engine = dashboard.XpEngine.from_history(old, STATS)
+    new = copy.deepcopy(old)
+    new[sorted(new)[20]] = {key: 1 for key in STATS}
+    new["2025-04-01"] = {key: 5 for key in STATS}
+    engine.sync(old, new)
+    assert engine_state(engine) == engine_state(dashboard.XpEngine.from_history(new, STATS))
+
+
+def test_streak_and_achievements():
+    history = {(datetime.date(2025, 1, 1) + datetime.timedelta(days=i)).isoformat(): {key: 10 for key in STATS} for i in range(7)}
+    engine = dashboard.XpEngine.from_history(history, STATS)
+    assert engine.current_streak("2025-01-08") == 7
+    assert engine.current_streak("2025-01-09") == 0
+    assert {"first_log", "streak_7", "perfect_day"} <= set(engine.achievements)
+
+
+def test_level_for_xp_at_boundaries():
+    curve = dashboard.DEFAULT_LEVEL_CURVE
+    for level in range(1, 30):
+        xp = dashboard.xp_for_level(level, curve)
+        assert dashboard.level_for_xp(xp, curve)[0] == level
+        if level > 1:
+            assert dashboard.level_for_xp(xp - 0.001, curve)[0] == level - 1
+
+
+# --- roll_over_data ---
+def test_roll_over_keeps_only_unfinished_work():
+    data = default_data()
+    data["Todo List"]["tasks"] = [task("open"), task("done", True)]
+    data["Eisenhower"]["do"] = [task("done", True)]
+    data["Eat the Frog"]["frog"] = {"title": "frog", "done": True}
+    data["3/3/3"]["outcomes"][1] = {"title": "slot", "done": True}
+    data["Ivy Lee Method"]["tasks"][3] = {"title": "carry", "done": False}
+    data["Ivy Lee Method"]["tasks"][0] = {"title": "finished", "done": True}
+    data["Ivy Lee Method"]["notes"] = "today"
+
+    snapshot, remaining = dashboard.roll_over_data(data)
+
+    assert snapshot == data
+    assert remaining["Todo List"]["tasks"] == [task("open")]
+    assert remaining["Eisenhower"]["do"] == []
+    assert remaining["Eat the Frog"]["frog"] == {"title": "", "done": False}
+    assert remaining["3/3/3"]["outcomes"][1] == {"title": "", "done": False}
+    assert [t["title"] for t in remaining["Ivy Lee Method"]["tasks"]] == ["carry", "", "", "", "", ""]
+    assert remaining["Ivy Lee Method"]["notes"] == ""
+
+
+# --- rule_occurs_on ---
+def rule(repeat, start):
+    return {"id": "r", "repeat": repeat, "start": start, "title": "t", "list": "todo"}
+
+
+def test_rules_start_on_their_start_date():
+    daily = rule("daily", "2025-06-10")
+    assert not dashboard.rule_occurs_on(daily, datetime.date(2025, 6, 9))
+    assert dashboard.rule_occurs_on(daily, datetime.date(2025, 6, 10))
+
+
+def test_weekly_and_weekday_rules():
+    weekly = rule("weekly", "2025-06-10")  # a Tuesday
+    assert dashboard.rule_occurs_on(weekly, datetime.date(2025, 6, 17))
+    assert not dashboard.rule_occurs_on(weekly, datetime.date(2025, 6, 18))
+    weekdays = rule("weekdays", "2025-06-10")
+    assert dashboard.rule_occurs_on(weekdays, datetime.date(2025, 6, 13))
+    assert not dashboard.rule_occurs_on(weekdays, datetime.date(2025, 6, 14))
+
+
+def test_monthly_rule_falls_on_the_last_day_of_shorter_months():
+    monthly = rule("monthly", "2025-01-31")
+    assert dashboard.rule_occurs_on(monthly, datetime.date(2025, 2, 28))
+    assert dashboard.rule_occurs_on(monthly, datetime.date(2025, 4, 30))
+    assert not dashboard.rule_occurs_on(monthly, datetime.date(2025, 5, 30))
+    assert dashboard.rule_occurs_on(monthly, datetime.date(2025, 5, 31))